@@ -19,7 +19,7 @@ print(audio.duration)
 pcm_bytes = audio.as_bytes("pcm")
 wav_bytes = audio.as_bytes("wav")
 
-# Note: mp3 may require additional dependencies such as pydub and ffmpeg
+# Note: mp3 requires additional dependencies, install with: pip install polytts[mp3]
 # mp3_bytes = audio.as_bytes("mp3")
 
 numpy_audio_int16 = audio.as_numpy("int16")
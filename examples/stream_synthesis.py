@@ -1,17 +1,16 @@
-import numpy as np
 import soundfile as sf
 
-from polytts import ElevenLabsTTS
+from polytts import ElevenLabsTTS, PCMStreamBuffer
 
 # Initialize the provider
 tts = ElevenLabsTTS(api_key="your-api-key")
 
-# Collect audio chunks
-audio_chunks = []
+# Collect audio chunks into a single growing buffer
+buffer = PCMStreamBuffer()
 for chunk in tts.stream("Hello, world!"):
-    audio_chunks.append(chunk.as_numpy("int16"))
+    buffer.append(chunk)
     print(chunk)
 
 # Save the audio
-audio = np.concatenate(audio_chunks)
-sf.write("output.wav", audio, tts.get_sample_rate())
\ No newline at end of file
+audio = buffer.finalize("int16")
+sf.write("output.wav", audio, tts.get_sample_rate())
@@ -4,14 +4,18 @@ PolyTTS - A unified interface for multiple TTS providers with seamless hotswappi
 Provides a consistent API across cloud-based and local TTS models.
 """
 
-from .audio import AudioData
+import importlib
+
+from .audio import AudioData, PCMStreamBuffer
+from .cache import ResponseCache
 from .constants import EncodedBytesFormat, AudioFormat, DType
-from .providers import *
 
 __version__ = "0.1.0"
 
 __all__ = [
     "AudioData",
+    "PCMStreamBuffer",
+    "ResponseCache",
     "EncodedBytesFormat",
     "AudioFormat",
     "DType",
@@ -20,4 +24,25 @@ __all__ = [
     "FishAudioTTS",
     "KokoroTTS",
     "GPTSovitsTTS",
-]
\ No newline at end of file
+]
+
+# Providers are imported on first access so `import polytts` stays cheap
+_PROVIDER_MODULES = {
+    "OpenAITTS": ".providers.openai",
+    "ElevenLabsTTS": ".providers.elevenlabs",
+    "FishAudioTTS": ".providers.fishaudio",
+    "KokoroTTS": ".providers.kokoro",
+    "GPTSovitsTTS": ".providers.gptsovits",
+}
+
+def __getattr__(name: str):
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    provider = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = provider
+    return provider
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
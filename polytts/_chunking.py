@@ -0,0 +1,126 @@
+import time
+from typing import AsyncIterable, AsyncGenerator, Generator, Iterable
+
+# Longest a provider stream holds audio back while coalescing, in seconds
+STREAM_MAX_DELAY = 0.1
+
+class ChunkCoalescer:
+    """
+    Regroup a byte stream into chunks of at least chunk_size bytes.
+
+    Emitted chunks are a whole number of frames, so PCM samples are never split
+    across chunks. Input chunks that are already large enough and aligned are
+    passed through without a copy. With max_delay set, buffered data is also
+    emitted once that many seconds have passed since the last chunk, so a slow
+    source never starves the consumer while the buffer fills.
+    """
+
+    def __init__(self, chunk_size: int, frame_size: int = 1, max_delay: float | None = None):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than 0")
+
+        # Round the target up to whole frames
+        self.chunk_size = -(-chunk_size // frame_size) * frame_size
+        self.frame_size = frame_size
+        self.max_delay = max_delay
+        self._buf = bytearray()
+        self._last_emit = time.monotonic()
+
+    def push(self, data: bytes) -> bytes | None:
+        """Add data to the buffer, returning a chunk once enough has accumulated."""
+        buffer = self._buf
+        overdue = False
+        if self.max_delay is not None:
+            now = time.monotonic()
+            overdue = now - self._last_emit >= self.max_delay
+
+        if not buffer and len(data) % self.frame_size == 0 and (len(data) >= self.chunk_size or (overdue and data)):
+            chunk = data
+        else:
+            buffer += data
+            if len(buffer) < self.chunk_size and not overdue:
+                return None
+
+            end = len(buffer) - len(buffer) % self.frame_size
+            if end == 0:
+                return None
+            with memoryview(buffer) as view:
+                chunk = view[:end].tobytes()
+            del buffer[:end]
+
+        if self.max_delay is not None:
+            self._last_emit = now
+        return chunk
+
+    def flush(self) -> bytes | None:
+        """Return any buffered data, zero-padded to a whole frame."""
+        buffer = self._buf
+        if not buffer:
+            return None
+
+        buffer.extend(bytes(-len(buffer) % self.frame_size))
+        chunk = bytes(buffer)
+        buffer.clear()
+        return chunk
+
+def coalesce_chunks(
+    chunks: Iterable[bytes],
+    chunk_size: int,
+    frame_size: int = 1,
+    max_delay: float | None = None
+) -> Generator[bytes, None, None]:
+    """Regroup an iterable of byte chunks with a ChunkCoalescer."""
+    coalescer = ChunkCoalescer(chunk_size, frame_size, max_delay)
+    for data in chunks:
+        if (chunk := coalescer.push(data)) is not None:
+            yield chunk
+    if (chunk := coalescer.flush()) is not None:
+        yield chunk
+
+async def coalesce_chunks_async(
+    chunks: AsyncIterable[bytes],
+    chunk_size: int,
+    frame_size: int = 1,
+    max_delay: float | None = None
+) -> AsyncGenerator[bytes, None]:
+    """Regroup an async iterable of byte chunks with a ChunkCoalescer."""
+    coalescer = ChunkCoalescer(chunk_size, frame_size, max_delay)
+    async for data in chunks:
+        if (chunk := coalescer.push(data)) is not None:
+            yield chunk
+    if (chunk := coalescer.flush()) is not None:
+        yield chunk
+
+def align_chunks(chunks: Iterable[bytes], frame_size: int = 2) -> Generator[bytes, None, None]:
+    """
+    Cut a byte stream on frame boundaries, carrying partial frames forward.
+
+    Chunks that are already aligned pass through without a copy. A trailing
+    partial frame is zero-padded.
+    """
+    carry = b""
+    for data in chunks:
+        if carry:
+            data = carry + data
+        end = len(data) - len(data) % frame_size
+        carry = data[end:]
+        if end:
+            yield data if end == len(data) else data[:end]
+    if carry:
+        yield carry + bytes(frame_size - len(carry))
+
+async def align_chunks_async(
+    chunks: AsyncIterable[bytes],
+    frame_size: int = 2
+) -> AsyncGenerator[bytes, None]:
+    """Async variant of align_chunks."""
+    carry = b""
+    async for data in chunks:
+        if carry:
+            data = carry + data
+        end = len(data) - len(data) % frame_size
+        carry = data[end:]
+        if end:
+            yield data if end == len(data) else data[:end]
+    if carry:
+        yield carry + bytes(frame_size - len(carry))
@@ -0,0 +1,53 @@
+"""
+Optional Numba kernels for the int16 <-> float32 conversion hot path.
+
+Each kernel scales and casts in a single streaming pass over the samples.
+Callers pass flat C-contiguous arrays so Numba compiles unit-stride loops that
+LLVM vectorizes with the host's SIMD instructions (AVX2, NEON).
+Numba is an optional dependency and slow to import, so it is only loaded and
+the kernels only defined on the first conversion that can use them. When it is
+not installed get_kernels() returns None and AudioConverter falls back to NumPy.
+"""
+from types import SimpleNamespace
+
+import numpy as np
+
+from ._optional import import_optional
+
+_MISSING = object()
+_kernels: SimpleNamespace | None | object = _MISSING
+
+def _build_kernels(numba) -> SimpleNamespace:
+    """Define and wrap the kernels with numba.njit."""
+    njit, prange = numba.njit, numba.prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def s16_to_f32(src: np.ndarray, dst: np.ndarray, scale: np.float32):
+        """Scale int16 samples into a float32 destination array."""
+        for i in prange(src.size):
+            dst[i] = src[i] * scale
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def f32_to_s16(src: np.ndarray, dst: np.ndarray, scale: np.float32):
+        """Scale float32 samples into an int16 destination array with saturation."""
+        for i in prange(src.size):
+            dst[i] = max(-32768.0, min(32767.0, np.rint(src[i] * scale)))
+
+    return SimpleNamespace(s16_to_f32=s16_to_f32, f32_to_s16=f32_to_s16)
+
+def get_kernels() -> SimpleNamespace | None:
+    """
+    Get the conversion kernels, importing Numba on the first call.
+
+    Returns:
+        Namespace with s16_to_f32 and f32_to_s16, or None if Numba is not installed
+    """
+    global _kernels
+    if _kernels is _MISSING:
+        numba = import_optional("numba")
+        _kernels = _build_kernels(numba) if numba is not None else None
+    return _kernels
+
+def has_numba() -> bool:
+    """Check whether Numba is installed, importing it on the first call."""
+    return get_kernels() is not None
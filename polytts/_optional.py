@@ -0,0 +1,21 @@
+import importlib
+from types import ModuleType
+
+_MISSING = object()
+_modules: dict[str, ModuleType | None] = {}
+
+def import_optional(name: str) -> ModuleType | None:
+    """
+    Import an optional dependency, caching the result.
+
+    Returns None if the module is not installed. Both outcomes are cached so
+    repeated calls on hot paths are a single dict lookup.
+    """
+    module = _modules.get(name, _MISSING)
+    if module is _MISSING:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            module = None
+        _modules[name] = module
+    return module
@@ -1,19 +1,22 @@
+import io
+import sys
+import wave
+import struct
 import numpy as np
-from functools import cached_property
-from dataclasses import dataclass
 
+from ._optional import import_optional
 from .codecs import AudioConverter
-from .constants import EncodedBytesFormat, AudioFormat, DType
+from .constants import EncodedBytesFormat, AudioFormat, DType, ByteOrder
 from .validation import AudioValidator
 
-@dataclass
 class AudioData:
     """
     Container for audio data with metadata and conversion utilities.
     
     Stores audio as either bytes (encoded formats like PCM, WAV, MP3) or
     numpy arrays (raw samples). Provides methods to convert between formats
-    and data types.
+    and data types. Instances are immutable, which lets decoded audio and
+    duration be cached safely.
     
     Attributes:
         data: Raw audio data as bytes or numpy array
@@ -22,17 +25,66 @@ class AudioData:
         dtype: Numpy dtype if data is numpy array, None otherwise
         duration: Audio duration in seconds
     """
-    data: bytes | np.ndarray
-    sample_rate: int
-    encoded_format: AudioFormat
+    # One instance is created per streamed chunk, so skip the per-instance __dict__
+    __slots__ = (
+        "_data",
+        "_sample_rate",
+        "_encoded_format",
+        "_is_numpy",
+        "_is_bytes",
+        "_dtype",
+        "_decoded",
+        "_duration",
+    )
 
-    def __post_init__(self):
-        """Validate inputs after dataclass initialization."""
+    def __init__(
+        self,
+        data: bytes | np.ndarray,
+        sample_rate: int,
+        encoded_format: AudioFormat
+    ):
+        """Validate inputs and initialize the audio container."""
         AudioValidator.validate_audio_data_inputs(
-            self.data,
-            self.sample_rate,
-            self.encoded_format
+            data,
+            sample_rate,
+            encoded_format
         )
+        self._assign(data, sample_rate, encoded_format)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        data: bytes | np.ndarray,
+        sample_rate: int,
+        encoded_format: AudioFormat
+    ) -> "AudioData":
+        """
+        Create an instance without validating the inputs.
+
+        For internal callers that produce many chunks whose data, sample rate
+        and format are valid by construction, such as model output.
+        """
+        audio = cls.__new__(cls)
+        audio._assign(data, sample_rate, encoded_format)
+        return audio
+
+    def _assign(
+        self,
+        data: bytes | np.ndarray,
+        sample_rate: int,
+        encoded_format: AudioFormat
+    ):
+        """Set the fields of a new instance."""
+        self._data = data
+        self._sample_rate = sample_rate
+        self._encoded_format = encoded_format
+        # Fields are read-only after init, so resolve the data type once
+        self._is_numpy = type(data) is np.ndarray or isinstance(data, np.ndarray)
+        self._is_bytes = not self._is_numpy
+        self._dtype = data.dtype if self._is_numpy else None
+        # Lazily computed by _decoded_int16 and duration
+        self._decoded = None
+        self._duration = None
 
     def __repr__(self) -> str:
         """Custom repr that properly shows computed properties."""
@@ -47,51 +99,124 @@ class AudioData:
             f")"
         )
 
+    @property
+    def data(self) -> bytes | np.ndarray:
+        """Raw audio data as bytes or numpy array."""
+        return self._data
+
+    @property
+    def sample_rate(self) -> int:
+        """Audio sample rate in Hz."""
+        return self._sample_rate
+
+    @property
+    def encoded_format(self) -> AudioFormat:
+        """Format of the audio data."""
+        return self._encoded_format
+
     @property
     def is_numpy(self) -> bool:
         """Check if audio data is stored as numpy array."""
-        return isinstance(self.data, np.ndarray)
+        return self._is_numpy
 
     @property
     def is_bytes(self) -> bool:
         """Check if audio data is stored as bytes."""
-        return isinstance(self.data, bytes)
+        return self._is_bytes
 
     @property
     def dtype(self) -> np.dtype | None:
         """Get numpy dtype of the data, or None if data is bytes."""
-        if self.is_numpy:
-            return self.data.dtype
-        return None
+        return self._dtype
 
-    @cached_property
+    @property
     def duration(self) -> float:
         """Get audio duration in seconds."""
-        if self.encoded_format == "raw":
-            return len(self.data) / self.sample_rate
-        elif self.encoded_format == "pcm":
-            num_samples = len(self.data) // 2
-            return num_samples / self.sample_rate
-        elif self.encoded_format == "mp3":
-            try:
-                import io
-                from mutagen.mp3 import MP3
-                audio = MP3(io.BytesIO(self.data))
-                return audio.info.length
-            except ImportError:
-                raise ImportError(
-                    "MP3 duration requires 'mutagen'. "
-                    "Install with: pip install mutagen"
-                )
-        elif self.encoded_format == "wav":
-            import io
-            import wave
-            with wave.open(io.BytesIO(self.data), "rb") as wav_file:
-                frames = wav_file.getnframes()
-                rate = wav_file.getframerate()
-                return frames / float(rate)
-
-    def as_bytes(self, output_format: EncodedBytesFormat = "pcm") -> bytes:
+        if self._duration is None:
+            self._duration = self._compute_duration()
+        return self._duration
+
+    def _compute_duration(self) -> float:
+        """
+        Compute audio duration in seconds.
+
+        Always read from the data or container header rather than the decoded
+        samples, which hold no channel count or decoded sample rate, so the
+        result does not depend on whether a conversion ran first.
+        """
+        return self._DURATIONS[self.encoded_format](self)
+
+    def _raw_duration(self) -> float:
+        """Duration of raw samples."""
+        return len(self.data) / self.sample_rate
+
+    def _pcm_duration(self) -> float:
+        """Duration of int16 PCM bytes."""
+        num_samples = len(self.data) // 2
+        return num_samples / self.sample_rate
+
+    def _mp3_duration(self) -> float:
+        """Duration of MP3 bytes, read from the frame headers."""
+        duration = AudioConverter._parse_mp3_duration(self.data)
+        if duration is not None:
+            return duration
+
+        # Anything unusual, like VBRI headers or a corrupt first frame
+        mutagen_mp3 = import_optional("mutagen.mp3")
+        if mutagen_mp3 is None:
+            raise ImportError(
+                "MP3 duration requires 'mutagen'. "
+                "Install with: pip install mutagen"
+            )
+        return mutagen_mp3.MP3(io.BytesIO(self.data)).info.length
+
+    def _wav_duration(self) -> float:
+        """Duration of WAV bytes, read from the RIFF header."""
+        try:
+            # Reading the header is enough, no need for a wave reader
+            sample_rate, channels, bits, _, length = AudioConverter._parse_wav_header(self.data)
+            return length // (channels * bits // 8) / sample_rate
+        except (ValueError, struct.error):
+            pass
+        with wave.open(io.BytesIO(self.data), "rb") as wav_file:
+            frames = wav_file.getnframes()
+            rate = wav_file.getframerate()
+            return frames / float(rate)
+
+    _DURATIONS = {
+        "raw": _raw_duration,
+        "pcm": _pcm_duration,
+        "mp3": _mp3_duration,
+        "wav": _wav_duration,
+    }
+
+    @property
+    def _decoded_int16(self) -> np.ndarray:
+        """
+        Int16 samples of the audio, decoded once and reused by conversions.
+
+        The array is read-only since it is shared between calls.
+        """
+        if self._decoded is None:
+            self._decoded = self._decode_int16()
+        return self._decoded
+
+    def _decode_int16(self) -> np.ndarray:
+        """Decode the audio to int16 samples."""
+        if self.is_bytes:
+            samples = AudioConverter._decode_to_numpy(self.data, self.encoded_format)
+        else:
+            samples = AudioConverter._numpy_to_int16(self.data)
+        if samples is self.data:
+            samples = samples.view()
+        samples.flags.writeable = False
+        return samples
+
+    def as_bytes(
+        self,
+        output_format: EncodedBytesFormat = "pcm",
+        byteorder: ByteOrder = "little"
+    ) -> bytes:
         """
         Convert audio data to bytes in specified format.
         
@@ -99,6 +224,9 @@ class AudioData:
         
         Args:
             output_format: Target format any of "pcm", "wav", or "mp3"
+
+            byteorder: Sample byte order of pcm output, any of "little", "big",
+                or "native". WAV and MP3 are always little-endian
         
         Returns:
             Audio data as bytes in the specified format
@@ -108,14 +236,34 @@ class AudioData:
             >>> pcm_bytes = audio.as_bytes("pcm")
             >>> wav_bytes = audio.as_bytes("wav")
         """
-        return AudioConverter.to_bytes(
-            self.data,
+        AudioValidator.validate_output_format(output_format)
+        AudioValidator.validate_byteorder(byteorder, output_format)
+
+        if byteorder == "native":
+            byteorder = sys.byteorder
+        if byteorder == "big" and output_format == "pcm":
+            # Swap while copying out, in one vectorized pass
+            return self._decoded_int16.astype(">i2").tobytes()
+
+        if self.is_bytes and self.encoded_format == output_format:
+            return self.data
+        if self.encoded_format == "wav" and output_format == "pcm":
+            # The payload is already PCM, slice it out without decoding
+            pcm = AudioConverter._wav_to_pcm(self.data)
+            if pcm is not None:
+                return pcm
+
+        return AudioConverter._encode_to_bytes(
+            self._decoded_int16,
             self.sample_rate,
-            self.encoded_format,
             output_format
         )
 
-    def as_numpy(self, target_dtype: DType = "float32") -> np.ndarray:
+    def as_numpy(
+        self,
+        target_dtype: DType = "float32",
+        out: np.ndarray | None = None
+    ) -> np.ndarray:
         """
         Convert audio data to numpy array with specified dtype.
         
@@ -124,17 +272,172 @@ class AudioData:
         
         Args:
             target_dtype: Target numpy dtype any of "float32", "float16", "int16", or "int32"
+
+            out: Optional preallocated array of target_dtype with one element
+                per sample to write the result into. Reusing one array across
+                same-sized chunks avoids allocating per conversion
         
         Returns:
-            Numpy array with mono audio samples in target dtype
+            Numpy array with mono audio samples in target dtype, which is out
+            when given
         
         Examples:
             >>> audio = AudioData(pcm_bytes, 24000, "pcm")
             >>> samples_float32 = audio.as_numpy("float32")
             >>> samples_int16 = audio.as_numpy("int16")
+            >>> scratch = np.empty(1024, dtype=np.float32)
+            >>> samples = chunk.as_numpy("float32", out=scratch)
+        """
+        AudioValidator.validate_target_dtype(target_dtype)
+
+        samples = self.data if self.is_numpy else self._decoded_int16
+        if out is not None:
+            AudioValidator.validate_out_array(out, target_dtype, samples.shape)
+        return AudioConverter._convert_to_dtype(samples, np.dtype(target_dtype), out)
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Get a read-only byte view over the stored audio without copying.
+
+        Unlike as_bytes, no decoding or conversion happens: bytes data is
+        viewed in its encoded format, and numpy data as the raw bytes of its
+        own dtype. Useful for handing audio to sockets or files directly.
+
+        Returns:
+            Read-only memoryview of unsigned bytes
+
+        Examples:
+            >>> audio = AudioData(pcm_bytes, 24000, "pcm")
+            >>> sock.sendall(audio.as_memoryview())
+        """
+        if self.is_bytes:
+            return memoryview(self.data)
+        samples = self.data if self.data.flags.c_contiguous else np.ascontiguousarray(self.data)
+        return memoryview(samples).cast("B").toreadonly()
+
+    @classmethod
+    def from_torch(cls, tensor, sample_rate: int) -> "AudioData":
+        """
+        Create raw AudioData from a torch tensor of mono samples.
+
+        CPU tensors are wrapped without a copy. Tensors on other devices are
+        copied to the host once. Dtypes numpy cannot represent, like bfloat16,
+        are converted to float32 first.
+
+        Args:
+            tensor: 1-D torch tensor of audio samples
+            sample_rate: Audio sample rate in Hz
+
+        Returns:
+            AudioData object with encoded format "raw"
+
+        Examples:
+            >>> audio = AudioData.from_torch(waveform, 24000)
+            >>> wav_bytes = audio.as_bytes("wav")
+        """
+        torch = import_optional("torch")
+        if torch is None:
+            raise ImportError(
+                "Torch conversion requires 'torch'. "
+                "Install with: pip install torch"
+            )
+
+        tensor = tensor.detach()
+        if tensor.dtype == torch.bfloat16:
+            tensor = tensor.float()
+        return cls(tensor.cpu().numpy(), sample_rate, "raw")
+
+    def as_torch(self, target_dtype: DType = "float32", device: str = "cpu"):
+        """
+        Convert audio data to a torch tensor with specified dtype.
+        
+        The tensor shares memory with the numpy samples on CPU. For other
+        devices it is copied over with a non-blocking transfer.
+        
+        Args:
+            target_dtype: Target dtype any of "float32", "float16", "int16", or "int32"
+            device: Torch device to place the tensor on (e.g., "cpu", "cuda")
+        
+        Returns:
+            1-D torch tensor with mono audio samples in target dtype
+        
+        Examples:
+            >>> audio = AudioData(pcm_bytes, 24000, "pcm")
+            >>> tensor = audio.as_torch("float32", device="cuda")
+        """
+        torch = import_optional("torch")
+        if torch is None:
+            raise ImportError(
+                "Torch conversion requires 'torch'. "
+                "Install with: pip install torch"
+            )
+
+        samples = self.as_numpy(target_dtype)
+        if not samples.flags.writeable:
+            # Shared cached samples are read-only, torch expects writable memory
+            samples = samples.copy()
+        tensor = torch.from_numpy(samples)
+        if device != "cpu":
+            tensor = tensor.to(device, non_blocking=True)
+        return tensor
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> np.ndarray:
+        """
+        Support np.asarray(audio) without an explicit conversion call.
+
+        Returns the stored array for raw audio, or the decoded int16 samples
+        (a view over the bytes for PCM and WAV) for encoded audio.
+        """
+        samples = self.data if self.is_numpy else self._decoded_int16
+        if dtype is not None:
+            samples = samples.astype(dtype, copy=False)
+        if copy:
+            samples = samples.copy()
+        return samples
+
+class PCMStreamBuffer:
+    """
+    Accumulator for streamed audio chunks.
+
+    Collects chunks as int16 PCM bytes in a single growing bytearray, avoiding
+    a list of per-chunk arrays and the extra copy of a final concatenation.
+
+    Example:
+        >>> buffer = PCMStreamBuffer()
+        >>> for chunk in tts.stream("Hello world"):
+        ...     buffer.append(chunk)
+        >>> samples = buffer.finalize("float32")
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def __len__(self) -> int:
+        """Number of samples accumulated so far."""
+        return len(self._buf) // 2
+
+    def append(self, chunk: AudioData):
+        """
+        Append an audio chunk to the buffer.
+
+        Args:
+            chunk: AudioData chunk, converted to int16 PCM before appending
+        """
+        self._buf.extend(chunk.as_bytes("pcm"))
+
+    def finalize(self, target_dtype: DType = "int16") -> np.ndarray:
+        """
+        Return all accumulated audio as a numpy array.
+
+        For int16 the returned array is a view over the internal buffer, so no
+        further chunks can be appended once it has been finalized.
+
+        Args:
+            target_dtype: Target numpy dtype any of "float32", "float16", "int16", or "int32"
+
+        Returns:
+            Numpy array with mono audio samples in target dtype
         """
-        return AudioConverter.to_numpy(
-            self.data,
-            self.encoded_format,
-            target_dtype
-        )
\ No newline at end of file
+        AudioValidator.validate_target_dtype(target_dtype)
+        samples = np.frombuffer(self._buf, dtype="<i2")
+        return AudioConverter._convert_to_dtype(samples, np.dtype(target_dtype))
@@ -1,4 +1,6 @@
-from typing import Generator, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncGenerator, Generator, Any
 from abc import ABC, abstractmethod
 
 from .audio import AudioData
@@ -15,6 +17,15 @@ class TTSProvider(ABC):
     the required abstract methods.
     """
 
+    # Upper bound on concurrent calls in the batch APIs. Local models that
+    # cannot safely run several inferences at once set this to 1
+    MAX_CONCURRENCY: int | None = None
+
+    # Constructor settings that change the synthesized audio, such as the model
+    # or language. They are part of every cache key, so instances configured
+    # differently never share cached responses
+    cache_config: dict[str, Any] = {}
+
     @abstractmethod
     def run(self, text: str, **kwargs: Any) -> AudioData:
         """
@@ -43,6 +54,25 @@ class TTSProvider(ABC):
         """
         pass
 
+    async def stream_async(self, text: str, **kwargs: Any) -> AsyncGenerator[AudioData, None]:
+        """
+        Generate speech from text in streaming mode without blocking the event loop.
+
+        The default implementation advances stream() in a worker thread.
+        Providers with an async SDK client override this so that streams
+        share the event loop instead of each holding a thread.
+
+        Args:
+            text: The text to convert to speech
+            **kwargs: Provider-specific parameters
+
+        Yields:
+            AudioData objects containing chunks of generated audio
+        """
+        chunks = self.stream(text, **kwargs)
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+
     @abstractmethod
     def get_sample_rate(self) -> int:
         """
@@ -51,4 +81,151 @@ class TTSProvider(ABC):
         Returns:
             Sample rate in Hz (e.g., 24000, 22050)
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def run_batch(
+        self,
+        texts: list[str],
+        *,
+        concurrency: int = 8,
+        **kwargs: Any
+    ) -> list[AudioData]:
+        """
+        Generate speech for several texts with bounded concurrency.
+
+        Each run() call executes in a worker thread, with at most concurrency
+        calls in flight at once.
+
+        Args:
+            texts: The texts to convert to speech
+
+            concurrency: Maximum number of simultaneous requests
+
+            **kwargs: Provider-specific parameters passed to every run() call
+
+        Returns:
+            AudioData objects in the same order as texts
+
+        Example:
+            >>> audios = await tts.run_batch(["Hello", "World"], concurrency=4)
+        """
+        semaphore = asyncio.Semaphore(self._batch_concurrency(concurrency))
+
+        async def run_one(text: str) -> AudioData:
+            async with semaphore:
+                return await asyncio.to_thread(self.run, text, **kwargs)
+
+        return list(await asyncio.gather(*(run_one(text) for text in texts)))
+
+    def run_batch_sync(
+        self,
+        texts: list[str],
+        *,
+        concurrency: int = 8,
+        **kwargs: Any
+    ) -> list[AudioData]:
+        """
+        Blocking version of run_batch() for code without an event loop.
+
+        Example:
+            >>> audios = tts.run_batch_sync(["Hello", "World"])
+        """
+        return asyncio.run(self.run_batch(texts, concurrency=concurrency, **kwargs))
+
+    def iter_batch(
+        self,
+        texts: list[str],
+        *,
+        concurrency: int = 8,
+        **kwargs: Any
+    ) -> Generator[tuple[int, AudioData], None, None]:
+        """
+        Generate speech for several texts, yielding results as they complete.
+
+        Unlike run_batch(), results are not held back for earlier texts, so
+        consumers can start processing the first finished request while the
+        rest are still in flight.
+
+        Args:
+            texts: The texts to convert to speech
+
+            concurrency: Maximum number of simultaneous requests
+
+            **kwargs: Provider-specific parameters passed to every run() call
+
+        Yields:
+            Tuples of (text index, AudioData) in completion order
+
+        Example:
+            >>> for index, audio in tts.iter_batch(["Hello", "World"]):
+            ...     print(index, audio)
+        """
+        with ThreadPoolExecutor(max_workers=self._batch_concurrency(concurrency)) as executor:
+            futures = {
+                executor.submit(self.run, text, **kwargs): index
+                for index, text in enumerate(texts)
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    async def stream_batch(
+        self,
+        texts: list[str],
+        *,
+        concurrency: int = 8,
+        **kwargs: Any
+    ) -> AsyncGenerator[tuple[int, AudioData], None]:
+        """
+        Stream speech for several texts with bounded concurrency.
+
+        Chunks are yielded as soon as any stream produces them, tagged with
+        the index of their text. Chunks of a single text keep their order.
+
+        Args:
+            texts: The texts to convert to speech
+
+            concurrency: Maximum number of simultaneous streams
+
+            **kwargs: Provider-specific parameters passed to every stream() call
+
+        Yields:
+            Tuples of (text index, AudioData chunk)
+
+        Example:
+            >>> async for index, chunk in tts.stream_batch(["Hello", "World"]):
+            ...     print(index, chunk)
+        """
+        semaphore = asyncio.Semaphore(self._batch_concurrency(concurrency))
+        queue: asyncio.Queue[tuple[int, AudioData] | None] = asyncio.Queue()
+
+        async def stream_one(index: int, text: str):
+            async with semaphore:
+                async for chunk in self.stream_async(text, **kwargs):
+                    await queue.put((index, chunk))
+
+        async def stream_all():
+            try:
+                await asyncio.gather(*(stream_one(index, text) for index, text in enumerate(texts)))
+            finally:
+                await queue.put(None)
+
+        producer = asyncio.create_task(stream_all())
+        try:
+            while (item := await queue.get()) is not None:
+                yield item
+            # Surface any error raised by a stream
+            await producer
+        finally:
+            producer.cancel()
+
+    def _batch_concurrency(self, concurrency: int) -> int:
+        """Clamp the requested batch concurrency to what the provider supports."""
+        if concurrency <= 0:
+            raise ValueError("concurrency must be greater than 0")
+        if self.MAX_CONCURRENCY is not None:
+            return min(concurrency, self.MAX_CONCURRENCY)
+        return concurrency
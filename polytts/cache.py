@@ -0,0 +1,377 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import inspect
+import functools
+import threading
+import numpy as np
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Callable, Generator
+
+from .audio import AudioData
+
+def _default_cache_dir() -> Path:
+    """Resolve the default on-disk cache directory."""
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "polytts"
+
+class ResponseCache:
+    """
+    Cache of synthesized audio keyed by provider call arguments.
+
+    An in-memory LRU front holds the most recent responses, backed by an
+    optional on-disk store so entries survive across processes. Each entry is
+    a list of AudioData chunks, so streamed responses replay with their
+    original chunk boundaries; a run() response is a single chunk.
+
+    The disk store is bounded by max_disk_bytes, evicting the least recently
+    used entries once a running total of the bytes written crosses it, and
+    expired entries are deleted when they are found. Use prune() to sweep
+    expired entries and re-measure the store, and clear(disk=True) to empty it.
+
+    Examples:
+        >>> tts = OpenAITTS(enable_cache=True)
+        >>> audio = tts.run("Hello world")  # Calls the API
+        >>> audio = tts.run("Hello world")  # Served from the cache
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        cache_dir: str | Path | None = None,
+        persist: bool = True,
+        ttl: float | None = None,
+        max_disk_bytes: int | None = 512 * 1024 * 1024
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            max_entries: Maximum number of responses held in memory
+
+            cache_dir: Directory for the on-disk store. Defaults to
+                ~/.cache/polytts (or $XDG_CACHE_HOME/polytts)
+
+            persist: Whether to write responses to disk
+
+            ttl: Seconds after which an entry expires. None never expires
+
+            max_disk_bytes: Maximum total size of the on-disk store, least
+                recently used entries are deleted past it. None is unbounded.
+                Default: 512 MiB
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        if max_disk_bytes is not None and max_disk_bytes <= 0:
+            raise ValueError("max_disk_bytes must be greater than 0")
+
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else _default_cache_dir()
+        self.persist = persist
+        self.ttl = ttl
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: OrderedDict[str, tuple[float, list[AudioData]]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Running estimate of the store's size, None until the first full scan
+        self._disk_bytes: int | None = None
+
+    @staticmethod
+    def make_key(provider: str, **params: Any) -> str:
+        """
+        Build a cache key from a provider name and its call parameters.
+
+        Returns:
+            Key of the form "<provider>/<blake2b hex digest>"
+        """
+        payload = json.dumps(params, sort_keys=True, default=repr)
+        digest = hashlib.blake2b(f"{provider}|{payload}".encode(), digest_size=20)
+        return f"{provider}/{digest.hexdigest()}"
+
+    def get(self, key: str) -> list[AudioData] | None:
+        """Return the cached chunks for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._is_expired(entry[0]):
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+        if not self.persist:
+            return None
+
+        entry = self._load(key)
+        if entry is None:
+            return None
+        self._remember(key, *entry)
+        return entry[1]
+
+    def put(self, key: str, chunks: list[AudioData]):
+        """Store the chunks of a response under key."""
+        created_at = time.time()
+        self._remember(key, created_at, chunks)
+        if self.persist:
+            self._store(key, created_at, chunks)
+
+    def clear(self, disk: bool = False):
+        """
+        Remove all in-memory entries.
+
+        Args:
+            disk: Whether to also delete every entry in the on-disk store
+        """
+        with self._lock:
+            self._entries.clear()
+        if disk:
+            for data_path, meta_path in self._disk_entries():
+                self._delete(data_path, meta_path)
+            self._disk_bytes = 0
+
+    def prune(self):
+        """
+        Delete expired entries from disk, then the least recently used ones
+        until the store fits in max_disk_bytes.
+        """
+        for data_path, meta_path in self._disk_entries():
+            try:
+                created_at = float(json.loads(meta_path.read_text())["created_at"])
+            except (OSError, ValueError, KeyError, TypeError):
+                created_at = None
+            if created_at is None or self._is_expired(created_at):
+                self._delete(data_path, meta_path)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """Delete the least recently used entries until the store fits in max_disk_bytes."""
+        if self.max_disk_bytes is None:
+            return
+
+        entries = []
+        total = 0
+        for data_path, meta_path in self._disk_entries():
+            try:
+                stat = data_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, data_path, meta_path))
+            total += stat.st_size
+
+        # Oldest first, loads refresh the payload's modification time
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, data_path, meta_path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            self._delete(data_path, meta_path)
+            total -= size
+        self._disk_bytes = total
+
+    def _disk_entries(self) -> list[tuple[Path, Path]]:
+        """List the payload and metadata paths of every entry on disk."""
+        if not self.cache_dir.is_dir():
+            return []
+        return [
+            (meta_path.with_suffix(".bin"), meta_path)
+            for meta_path in self.cache_dir.glob("*/*.json")
+        ]
+
+    @staticmethod
+    def _delete(data_path: Path, meta_path: Path):
+        """Delete an entry from disk, metadata first so it is never read half-removed."""
+        for path in (meta_path, data_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _is_expired(self, created_at: float) -> bool:
+        """Check whether an entry created at the given time has expired."""
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def _remember(self, key: str, created_at: float, chunks: list[AudioData]):
+        """Insert an entry into the in-memory LRU, evicting the oldest if full."""
+        with self._lock:
+            self._entries[key] = (created_at, chunks)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        """Get the payload and metadata paths of a key."""
+        path = self.cache_dir / key
+        return path.with_suffix(".bin"), path.with_suffix(".json")
+
+    def _store(self, key: str, created_at: float, chunks: list[AudioData]):
+        """Write an entry to disk, payload first so metadata marks it complete."""
+        data_path, meta_path = self._paths(key)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+
+        payloads = [
+            chunk.data if chunk.is_bytes else np.ascontiguousarray(chunk.data)
+            for chunk in chunks
+        ]
+        first = chunks[0]
+        metadata = {
+            "sample_rate": first.sample_rate,
+            "encoded_format": first.encoded_format,
+            "dtype": str(first.dtype) if first.is_numpy else None,
+            "chunks": [memoryview(payload).nbytes for payload in payloads],
+            "created_at": created_at,
+            "ttl": self.ttl,
+        }
+
+        self._write_atomic(data_path, payloads)
+        self._write_atomic(meta_path, [json.dumps(metadata).encode()])
+
+        if self.max_disk_bytes is None:
+            return
+        # Only rescan the store once the running total crosses the limit.
+        # Overwrites and deletions make it an overestimate, which just
+        # brings the next scan forward, and each scan resets it
+        if self._disk_bytes is not None:
+            with self._lock:
+                self._disk_bytes += sum(metadata["chunks"])
+                if self._disk_bytes <= self.max_disk_bytes:
+                    return
+        self._evict_disk()
+
+    @staticmethod
+    def _write_atomic(path: Path, payloads: list[Any]):
+        """
+        Write payloads to a uniquely named temporary file, then rename it over path.
+
+        Concurrent writers of the same key each get their own temporary file,
+        and readers only ever see a complete file or none.
+        """
+        f = tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+        )
+        try:
+            with f:
+                for payload in payloads:
+                    f.write(payload)
+            os.replace(f.name, path)
+        except BaseException:
+            try:
+                os.unlink(f.name)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _load(self, key: str) -> tuple[float, list[AudioData]] | None:
+        """
+        Read an entry from disk, or None if it is missing, expired or corrupt.
+
+        Expired entries and entries whose metadata does not describe the
+        payload are deleted.
+        """
+        data_path, meta_path = self._paths(key)
+        try:
+            metadata = json.loads(meta_path.read_text())
+            data = data_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._delete(data_path, meta_path)
+            return None
+
+        try:
+            created_at = float(metadata["created_at"])
+            if self._is_expired(created_at):
+                self._delete(data_path, meta_path)
+                return None
+
+            lengths = [int(length) for length in metadata["chunks"]]
+            if sum(lengths) != len(data):
+                raise ValueError("chunk lengths do not match the payload size")
+            dtype = metadata["dtype"]
+
+            chunks = []
+            offset = 0
+            for length in lengths:
+                payload = data[offset:offset + length]
+                offset += length
+                if dtype is not None:
+                    payload = np.frombuffer(payload, dtype=dtype)
+                chunks.append(AudioData(payload, metadata["sample_rate"], metadata["encoded_format"]))
+        except (KeyError, TypeError, ValueError):
+            self._delete(data_path, meta_path)
+            return None
+
+        # Mark the entry as recently used for disk eviction
+        try:
+            os.utime(data_path)
+        except OSError:
+            pass
+        return created_at, chunks
+
+def _call_key(provider: Any, method: Callable, args: tuple, kwargs: dict) -> str:
+    """
+    Build the cache key of a provider method call.
+
+    Includes default arguments and the provider's cache_config, so instances
+    with different constructor settings get different keys.
+    """
+    bound = inspect.signature(method).bind(provider, *args, **kwargs)
+    bound.apply_defaults()
+    params = dict(bound.arguments)
+    params.pop("self")
+    params.update(params.pop("kwargs", {}))
+    return ResponseCache.make_key(
+        type(provider).__name__,
+        method=method.__name__,
+        config=getattr(provider, "cache_config", {}),
+        params=params
+    )
+
+def cached_run(method: Callable[..., AudioData]) -> Callable[..., AudioData]:
+    """Serve a provider's run() from its ResponseCache when caching is enabled."""
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> AudioData:
+        cache = getattr(self, "cache", None)
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        key = _call_key(self, method, args, kwargs)
+        chunks = cache.get(key)
+        if chunks is not None:
+            return chunks[0]
+
+        audio = method(self, *args, **kwargs)
+        cache.put(key, [audio])
+        return audio
+
+    return wrapper
+
+def cached_stream(
+    method: Callable[..., Generator[AudioData, None, None]]
+) -> Callable[..., Generator[AudioData, None, None]]:
+    """
+    Serve a provider's stream() from its ResponseCache when caching is enabled.
+
+    On a miss, chunks are passed through as they arrive and stored once the
+    stream completes. Partially consumed streams are not cached.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Generator[AudioData, None, None]:
+        cache = getattr(self, "cache", None)
+        if cache is None:
+            yield from method(self, *args, **kwargs)
+            return
+
+        key = _call_key(self, method, args, kwargs)
+        chunks = cache.get(key)
+        if chunks is not None:
+            yield from chunks
+            return
+
+        chunks = []
+        for chunk in method(self, *args, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            cache.put(key, chunks)
+
+    return wrapper
@@ -1,10 +1,129 @@
-from re import S
+import io
+import wave
+import struct
 import numpy as np
-from typing import get_args
+from typing import Callable, Generator, Iterable, get_args
 
+from . import _codec_kernels
+from ._optional import import_optional
 from .constants import EncodedBytesFormat, AudioFormat, DType
 from .validation import AudioValidator
 
+# Scale factors kept as float32 scalars so NumPy never promotes to float64
+_F32_INT16_SCALE = np.float32(32768.0)
+_F32_INT16_INV = np.float32(1.0 / 32768.0)
+
+# PCM and WAV samples are little-endian int16 regardless of the host
+_PCM_DTYPE = np.dtype("<i2")
+
+# MPEG Layer III header tables, indexed by the version bits (0 is MPEG 2.5, 1 is reserved)
+_MP3_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+_MP3_BITRATES_MPEG1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_MPEG2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+def _make_converter(
+    source_dtype: np.dtype,
+    target_dtype: np.dtype
+) -> Callable[[np.ndarray, np.ndarray | None], np.ndarray]:
+    """
+    Build a conversion function for one dtype pair with its scale factors baked in.
+
+    The returned function takes the samples and an optional preallocated
+    output array of the target dtype, which is filled and returned instead of
+    allocating a new one.
+    """
+    if source_dtype.kind == "u":
+        # Unsigned PCM is offset binary, flipping the top bit centres it on
+        # zero so the signed converter of the same width applies
+        signed_dtype = np.dtype(source_dtype.str.replace("u", "i"))
+        sign_bit = signed_dtype.type(np.iinfo(signed_dtype).min)
+        convert_signed = _make_converter(signed_dtype, target_dtype)
+
+        def unsigned_to_any(data: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+            return convert_signed(np.bitwise_xor(data.view(signed_dtype), sign_bit), out)
+
+        return unsigned_to_any
+
+    source_is_float = source_dtype.kind == "f"
+    target_is_float = target_dtype.kind == "f"
+
+    if source_dtype == target_dtype:
+        def identity(data: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+            if out is None:
+                return data
+            np.copyto(out, data)
+            return out
+
+        return identity
+
+    if source_is_float and target_is_float:
+        def float_to_float(data: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+            if out is None:
+                return data.astype(target_dtype)
+            np.copyto(out, data, casting="unsafe")
+            return out
+
+        return float_to_float
+
+    if source_is_float:
+        info = np.iinfo(target_dtype)
+        if info.bits <= 16:
+            work_dtype, scale = np.float32, _F32_INT16_SCALE
+        else:
+            # float32 cannot represent the int32 range exactly
+            work_dtype, scale = np.float64, np.float64(-info.min)
+        use_kernel = source_dtype == np.float32 and target_dtype == np.int16
+
+        def float_to_int(data: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+            # Kernels get flat contiguous arrays so the compiled loops vectorize
+            kernels = _codec_kernels.get_kernels() if use_kernel else None
+            if kernels and data.flags.c_contiguous and (out is None or out.flags.c_contiguous):
+                if out is None:
+                    out = np.empty(data.shape, dtype=target_dtype)
+                kernels.f32_to_s16(data.reshape(-1), out.reshape(-1), scale)
+                return out
+            scaled = np.multiply(data, scale, dtype=work_dtype)
+            np.clip(scaled, info.min, info.max, out=scaled)
+            np.rint(scaled, out=scaled)
+            if out is None:
+                return scaled.astype(target_dtype)
+            np.copyto(out, scaled, casting="unsafe")
+            return out
+
+        return float_to_int
+
+    if target_is_float:
+        # Multiplying by the reciprocal is cheaper than dividing
+        scale = np.float32(-1.0 / np.iinfo(source_dtype).min)
+        use_kernel = source_dtype == np.int16 and target_dtype == np.float32
+
+        def int_to_float(data: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+            if out is None:
+                out = np.empty(data.shape, dtype=target_dtype)
+            kernels = _codec_kernels.get_kernels() if use_kernel else None
+            if kernels and data.flags.c_contiguous and out.flags.c_contiguous:
+                kernels.s16_to_f32(data.reshape(-1), out.reshape(-1), scale)
+                return out
+            return np.multiply(data, scale, out=out, dtype=np.float32, casting="unsafe")
+
+        return int_to_float
+
+    # Integer rescaling is a bit shift by the difference in sample width
+    shift = 8 * (target_dtype.itemsize - source_dtype.itemsize)
+
+    def int_to_int(data: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        if out is None:
+            out = np.empty(data.shape, dtype=target_dtype)
+        if shift >= 0:
+            return np.left_shift(data, shift, out=out, dtype=target_dtype)
+        return np.right_shift(data, -shift, out=out, casting="unsafe")
+
+    return int_to_int
+
 class AudioConverter:
     """Handles encoding and decoding between audio formats."""
     
@@ -37,7 +156,15 @@ class AudioConverter:
         if isinstance(data, bytes):
             if encoded_format == output_format:
                 return data
+            if encoded_format == "pcm" and output_format == "wav":
+                return AudioConverter._wav_header(len(data), sample_rate) + data
+            if encoded_format == "wav" and output_format == "pcm":
+                pcm = AudioConverter._wav_to_pcm(data)
+                if pcm is not None:
+                    return pcm
             data = AudioConverter._decode_to_numpy(data, encoded_format)
+        elif data.dtype == _PCM_DTYPE and output_format == "pcm":
+            return data.tobytes()
         else:
             data = AudioConverter._numpy_to_int16(data)
         
@@ -74,6 +201,69 @@ class AudioConverter:
         
         return AudioConverter._convert_to_dtype(data, np.dtype(target_dtype))
 
+    @staticmethod
+    def stream_decode_mp3(
+        chunks: Iterable[bytes],
+        sample_rate: int,
+        frames_per_read: int = 1152
+    ) -> Generator[np.ndarray, None, None]:
+        """
+        Incrementally decode a stream of MP3 bytes to int16 samples.
+
+        Samples are yielded as soon as MPEG frames are decoded, instead of
+        waiting for the complete stream. Requires 'miniaudio'.
+        
+        Args:
+            chunks: Iterable of MP3 byte chunks, in stream order
+            sample_rate: Sample rate of the encoded stream in Hz
+            frames_per_read: Number of samples decoded per yielded array
+        
+        Yields:
+            Int16 numpy arrays with mono audio samples
+
+        Examples:
+            >>> chunks = (chunk.data for chunk in tts.stream(text, response_format="mp3"))
+            >>> for samples in AudioConverter.stream_decode_mp3(chunks, 44100):
+            ...     play(samples)
+        """
+        AudioValidator.validate_sample_rate(sample_rate)
+        miniaudio = import_optional("miniaudio")
+        if miniaudio is None:
+            raise ImportError(
+                "Streaming MP3 decoding requires 'miniaudio'. "
+                "Install: pip install polytts[mp3]"
+            )
+
+        class ChunkSource(miniaudio.StreamableSource):
+            """Feeds the decoder from the chunk iterator on demand."""
+
+            def __init__(self):
+                self.chunks = iter(chunks)
+                self.pending = bytearray()
+
+            def read(self, num_bytes: int) -> bytes:
+                # The decoder treats a short read as end of stream
+                while len(self.pending) < num_bytes:
+                    chunk = next(self.chunks, None)
+                    if chunk is None:
+                        break
+                    self.pending.extend(chunk)
+                data = bytes(self.pending[:num_bytes])
+                del self.pending[:num_bytes]
+                return data
+
+        with ChunkSource() as source:
+            stream = miniaudio.stream_any(
+                source,
+                source_format=miniaudio.FileFormat.MP3,
+                output_format=miniaudio.SampleFormat.SIGNED16,
+                nchannels=1,
+                sample_rate=sample_rate,
+                frames_to_read=frames_per_read
+            )
+            for samples in stream:
+                yield np.frombuffer(samples, dtype=np.int16)
+
     @staticmethod
     def _encode_to_bytes(
         data: np.ndarray,
@@ -81,167 +271,275 @@ class AudioConverter:
         output_format: EncodedBytesFormat
     ) -> bytes:
         """Encode numpy array to bytes in specified format."""
-        match output_format:
-            case "pcm":
-                return AudioConverter._encode_pcm(data)
-            case "wav":
-                return AudioConverter._encode_wav(data, sample_rate)
-            case "mp3":
-                return AudioConverter._encode_mp3(data, sample_rate)
-            case _:
-                raise ValueError(f"Cannot encode format: {output_format}")
+        encoder = AudioConverter._ENCODERS.get(output_format)
+        if encoder is None:
+            raise ValueError(f"Cannot encode format: {output_format}")
+        return encoder(data, sample_rate)
 
     @staticmethod
     def _numpy_to_int16(data: np.ndarray) -> np.ndarray:
         """Convert numpy array to int16 samples."""
-        if data.dtype in (np.float16, np.float32):
-            return (data * 32767.0).astype(np.int16)
-        else:
-            return data.astype(np.int16)
+        return AudioConverter._convert_to_dtype(data, np.dtype(np.int16))
     
     @staticmethod
-    def _convert_to_dtype(data: np.ndarray, target_dtype: np.dtype) -> np.ndarray:
-        """Convert numpy array to target dtype with proper scaling."""
-        if data.dtype == target_dtype:
-            return data
-        
-        current_is_float = data.dtype in (np.float16, np.float32)
-        target_is_float = target_dtype in (np.float16, np.float32)
-        
-        if current_is_float and not target_is_float:
-            target_max = np.iinfo(target_dtype).max
-            return (data * target_max).astype(target_dtype)
-        
-        if not current_is_float and target_is_float:
-            current_max = np.iinfo(data.dtype).max
-            return (data / current_max).astype(target_dtype)
-        
-        if current_is_float and target_is_float:
-            return data.astype(target_dtype)
-        
-        current_max = np.iinfo(data.dtype).max
-        target_max = np.iinfo(target_dtype).max
-        
-        if current_max < target_max:
-            scale = target_max // current_max
-            return (data.astype(target_dtype) * scale).astype(target_dtype)
-        elif current_max > target_max:
-            scale = current_max // target_max
-            return (data // scale).astype(target_dtype)
-        
-        return data.astype(target_dtype)
+    def _convert_to_dtype(
+        data: np.ndarray,
+        target_dtype: np.dtype,
+        out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Convert numpy array to target dtype with proper scaling.
+
+        Integer samples map to floats in [-1.0, 1.0) by their full scale
+        (32768 for int16), and floats are rounded and saturated to the
+        integer range on the way back, so out-of-range values clip instead
+        of wrapping around. If out is given, the result is written into it.
+        """
+        converter = _CONVERTERS.get((data.dtype, target_dtype))
+        if converter is None:
+            # Dtypes outside DType, such as float64 input from user code
+            converter = _make_converter(data.dtype, target_dtype)
+        return converter(data, out)
         
     @staticmethod
     def _decode_to_numpy(data: bytes, encoded_format: EncodedBytesFormat) -> np.ndarray:
         """Decode bytes to int16 mono numpy array."""
-        match encoded_format:
-            case "pcm":
-                return AudioConverter._decode_pcm(data)
-            case "wav":
-                return AudioConverter._decode_wav(data)
-            case "mp3":
-                return AudioConverter._decode_mp3(data)
-            case _:
-                raise ValueError(f"Cannot decode format: {encoded_format}")
+        decoder = AudioConverter._DECODERS.get(encoded_format)
+        if decoder is None:
+            raise ValueError(f"Cannot decode format: {encoded_format}")
+        return decoder(data)
     
     @staticmethod
     def _decode_pcm(data: bytes) -> np.ndarray:
         """Decode PCM bytes to int16 numpy array."""
-        return np.frombuffer(data, dtype=np.int16)
+        return np.frombuffer(data, dtype=_PCM_DTYPE)
     
+    @staticmethod
+    def _parse_wav_header(data: bytes) -> tuple[int, int, int, int, int]:
+        """
+        Locate the samples of 16-bit PCM WAV bytes.
+
+        Walks the RIFF chunks, so LIST/INFO chunks before the data chunk are
+        skipped over.
+
+        Returns:
+            Tuple of (sample_rate, channels, bits_per_sample, data_offset,
+            data_length), with the offset and length in bytes
+        """
+        if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+            raise ValueError("Data is not a RIFF/WAVE file")
+        
+        sample_rate = channels = bits = None
+        offset = 12
+        while offset + 8 <= len(data):
+            chunk_id, chunk_size = struct.unpack_from("<4sI", data, offset)
+            offset += 8
+            if chunk_id == b"fmt ":
+                audio_format, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", data, offset)
+                # 1 is plain PCM, 0xFFFE is WAVE_FORMAT_EXTENSIBLE
+                if audio_format not in (1, 0xFFFE) or bits != 16:
+                    raise ValueError("Only 16-bit PCM WAV data is supported")
+            elif chunk_id == b"data":
+                if sample_rate is None:
+                    raise ValueError("WAV data chunk precedes the fmt chunk")
+                # Streamed WAVs may declare a placeholder size, clamp to what we have
+                return sample_rate, channels, bits, offset, min(chunk_size, len(data) - offset)
+            # Chunks are padded to an even size
+            offset += chunk_size + (chunk_size & 1)
+        
+        raise ValueError("WAV data chunk not found")
+
+    @staticmethod
+    def _parse_mp3_duration(data: bytes) -> float | None:
+        """
+        Read the duration of MP3 bytes from the first frame only.
+
+        Uses the frame count of a Xing/Info header, minus the LAME encoder
+        delay and padding when present, and otherwise assumes a constant
+        bitrate. Matches what mutagen reports for these files.
+
+        Returns:
+            Duration in seconds, or None if the header is not understood
+        """
+        offset = 0
+        if data[:3] == b"ID3" and len(data) >= 10:
+            # Tag size is a 28-bit syncsafe integer, plus a footer if flagged
+            offset = 10 + (data[6] << 21 | data[7] << 14 | data[8] << 7 | data[9])
+            if data[5] & 0x10:
+                offset += 10
+        if offset + 4 > len(data) or data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+            return None
+
+        version = (data[offset + 1] >> 3) & 0x3
+        layer = (data[offset + 1] >> 1) & 0x3
+        bitrate_index = data[offset + 2] >> 4
+        rate_index = (data[offset + 2] >> 2) & 0x3
+        # Only Layer III, and skip reserved or free-format values
+        if version == 1 or layer != 1 or rate_index == 3 or bitrate_index in (0, 15):
+            return None
+
+        mpeg1 = version == 3
+        mono = data[offset + 3] >> 6 == 3
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+        samples_per_frame = 1152 if mpeg1 else 576
+
+        # The Xing header follows the side information of the first frame
+        side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+        xing = offset + 4 + side_info
+        tag = data[xing:xing + 4]
+        if tag in (b"Xing", b"Info"):
+            if xing + 12 > len(data):
+                return None
+            flags = int.from_bytes(data[xing + 4:xing + 8], "big")
+            if not flags & 0x1:
+                return None
+            samples = int.from_bytes(data[xing + 8:xing + 12], "big") * samples_per_frame
+
+            # The LAME tag comes after the frames, bytes, TOC and quality fields
+            lame = xing + 12 + 4 * bool(flags & 0x2) + 100 * bool(flags & 0x4) + 4 * bool(flags & 0x8)
+            if data[lame:lame + 4] == b"LAME" and lame + 24 <= len(data) and data[lame + 9] >> 4 == 0:
+                delay_padding = int.from_bytes(data[lame + 21:lame + 24], "big")
+                samples -= (delay_padding >> 12) + (delay_padding & 0xFFF)
+            return max(samples, 0) / sample_rate
+        if tag == b"VBRI" or data[offset + 36:offset + 40] == b"VBRI":
+            return None
+
+        bitrates = _MP3_BITRATES_MPEG1 if mpeg1 else _MP3_BITRATES_MPEG2
+        return 8 * (len(data) - offset) / (bitrates[bitrate_index] * 1000)
+
+    @staticmethod
+    def _wav_to_pcm(data: bytes) -> bytes | None:
+        """Slice the PCM payload out of WAV bytes, or None if the header is not understood."""
+        try:
+            _, _, _, offset, length = AudioConverter._parse_wav_header(data)
+        except (ValueError, struct.error):
+            return None
+        return data[offset:offset + length - length % 2]
+
     @staticmethod
     def _decode_wav(data: bytes) -> np.ndarray:
-        """Decode WAV bytes to int16 numpy array."""
-        import io
-        import wave
+        """Decode WAV bytes to int16 numpy array, as a view over the input when possible."""
+        try:
+            _, _, _, offset, length = AudioConverter._parse_wav_header(data)
+        except (ValueError, struct.error):
+            # Let the wave module handle, or reject, anything unusual
+            with wave.open(io.BytesIO(data), "rb") as wav_file:
+                frames = wav_file.readframes(wav_file.getnframes())
+                return np.frombuffer(frames, dtype=_PCM_DTYPE)
         
-        with wave.open(io.BytesIO(data), "rb") as wav_file:
-            frames = wav_file.readframes(wav_file.getnframes())
-            return np.frombuffer(frames, dtype=np.int16)
+        return np.frombuffer(data, dtype=_PCM_DTYPE, offset=offset, count=length // 2)
     
     @staticmethod
     def _decode_mp3(data: bytes) -> np.ndarray:
         """Decode MP3 bytes to int16 numpy array."""
-        try:
-            import io
-            from pydub import AudioSegment
-            
-            audio_seg = AudioSegment.from_mp3(io.BytesIO(data))
-            return np.array(audio_seg.get_array_of_samples(), dtype=np.int16)
-        except ImportError:
+        miniaudio = import_optional("miniaudio")
+        if miniaudio is None:
+            return AudioConverter._decode_mp3_pydub(data)
+
+        decoded = miniaudio.mp3_read_s16(data)
+        samples = np.frombuffer(decoded.samples, dtype=np.int16)
+        if decoded.nchannels > 1:
+            samples = samples.reshape(-1, decoded.nchannels).mean(axis=1).astype(np.int16)
+        return samples
+
+    @staticmethod
+    def _decode_mp3_pydub(data: bytes) -> np.ndarray:
+        """Decode MP3 bytes to int16 numpy array through pydub and ffmpeg."""
+        pydub = import_optional("pydub")
+        if pydub is None:
             raise ImportError(
-                "MP3 decoding requires 'pydub' and 'ffmpeg'. "
-                "Install: pip install pydub"
+                "MP3 decoding requires 'miniaudio', or 'pydub' and 'ffmpeg'. "
+                "Install: pip install polytts[mp3]"
             )
+
+        audio_seg = pydub.AudioSegment.from_mp3(io.BytesIO(data)).set_channels(1)
+        return np.array(audio_seg.get_array_of_samples(), dtype=np.int16)
     
     @staticmethod
-    def _encode_pcm(data: np.ndarray) -> bytes:
-        """Encode int16 numpy array to PCM format bytes."""
-        return data.tobytes()
+    def _encode_pcm(data: np.ndarray, sample_rate: int) -> bytes:
+        """Encode int16 numpy array to PCM format bytes. Sample rate is unused."""
+        return data.astype(_PCM_DTYPE, copy=False).tobytes()
+
+    @staticmethod
+    def _wav_header(num_bytes: int, sample_rate: int) -> bytes:
+        """Build the 44-byte RIFF header for mono int16 PCM data."""
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + num_bytes, b"WAVE",
+            b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b"data", num_bytes
+        )
 
     @staticmethod
     def _encode_wav(data: np.ndarray, sample_rate: int) -> bytes:
         """Encode int16 numpy array to WAV format bytes."""
-        import io
-        import wave
-        
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(data.tobytes())
-        
-        return buffer.getvalue()
+        # join reads the array buffer directly, so the payload is copied only once
+        samples = np.ascontiguousarray(data, dtype=_PCM_DTYPE)
+        header = AudioConverter._wav_header(samples.nbytes, sample_rate)
+        return b"".join((header, samples))
     
     @staticmethod
     def _encode_mp3(data: np.ndarray, sample_rate: int) -> bytes:
         """Encode int16 numpy array to MP3 format bytes."""
-        try:
-            import io
-            from pydub import AudioSegment
-            
-            audio = AudioSegment(
-                data=data.tobytes(),
-                sample_width=2,
-                frame_rate=sample_rate,
-                channels=1
-            )
-            
-            buffer = io.BytesIO()
-            audio.export(
-                buffer,
-                format="mp3",
-                codec="libmp3lame",
-                bitrate="128k"
-            )
-            return buffer.getvalue()
-        except ImportError:
+        lameenc = import_optional("lameenc")
+        if lameenc is None:
+            return AudioConverter._encode_mp3_pydub(data, sample_rate)
+
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(128)
+        encoder.set_in_sample_rate(sample_rate)
+        encoder.set_channels(1)
+        encoder.set_quality(2)
+        return bytes(encoder.encode(data.tobytes()) + encoder.flush())
+
+    @staticmethod
+    def _encode_mp3_pydub(data: np.ndarray, sample_rate: int) -> bytes:
+        """Encode int16 numpy array to MP3 format bytes through pydub and ffmpeg."""
+        pydub = import_optional("pydub")
+        if pydub is None:
             raise ImportError(
-                "MP3 encoding requires 'pydub' and 'ffmpeg'. "
-                "Install: pip install pydub"
+                "MP3 encoding requires 'lameenc', or 'pydub' and 'ffmpeg'. "
+                "Install: pip install polytts[mp3]"
             )
 
-    @staticmethod
-    def validate_to_bytes_inputs(
-        data: bytes | np.ndarray,
-        sample_rate: int,
-        encoded_format: str,
-        output_format: str
-    ):
-        """Validate all inputs for to_bytes conversion."""
-        AudioValidator.validate_data(data)
-        AudioValidator.validate_sample_rate(sample_rate)
-        AudioValidator.validate_encoded_format(encoded_format)
-        AudioValidator.validate_output_format(output_format)
-    
-    @staticmethod
-    def validate_to_numpy_inputs(
-        data: bytes | np.ndarray,
-        encoded_format: str,
-        target_dtype: str
-    ):
-        """Validate all inputs for to_numpy conversion."""
-        AudioValidator.validate_data(data)
-        AudioValidator.validate_encoded_format(encoded_format)
-        AudioValidator.validate_target_dtype(target_dtype)
\ No newline at end of file
+        audio = pydub.AudioSegment(
+            data=data.tobytes(),
+            sample_width=2,
+            frame_rate=sample_rate,
+            channels=1
+        )
+        
+        buffer = io.BytesIO()
+        audio.export(
+            buffer,
+            format="mp3",
+            codec="libmp3lame",
+            bitrate="128k"
+        )
+        return buffer.getvalue()
+
+    # Format dispatch tables, built once the codec methods are defined
+    _ENCODERS = {
+        "pcm": _encode_pcm,
+        "wav": _encode_wav,
+        "mp3": _encode_mp3,
+    }
+    _DECODERS = {
+        "pcm": _decode_pcm,
+        "wav": _decode_wav,
+        "mp3": _decode_mp3,
+    }
+
+    # Validation lives in AudioValidator, these names are kept for existing callers
+    validate_to_bytes_inputs = staticmethod(AudioValidator.validate_to_bytes_inputs)
+    validate_to_numpy_inputs = staticmethod(AudioValidator.validate_to_numpy_inputs)
+
+# Unsigned PCM sources are common enough to build their converters up front too
+_UNSIGNED_SOURCES = ("uint8", "uint16")
+
+# Specialised converters for every supported (source, target) dtype pair
+_CONVERTERS = {
+    (np.dtype(source), np.dtype(target)): _make_converter(np.dtype(source), np.dtype(target))
+    for source in get_args(DType) + _UNSIGNED_SOURCES
+    for target in get_args(DType)
+}
@@ -1,11 +1,4 @@
-# Cloud/API providers
-from .openai import OpenAITTS
-from .elevenlabs import ElevenLabsTTS
-from .fishaudio import FishAudioTTS
-
-# Local models
-from .kokoro import KokoroTTS
-from .gptsovits import GPTSovitsTTS
+import importlib
 
 __all__ = [
     "OpenAITTS",
@@ -13,4 +6,27 @@ __all__ = [
     "FishAudioTTS",
     "KokoroTTS",
     "GPTSovitsTTS",
-]
\ No newline at end of file
+]
+
+# Providers are imported on first access so importing one does not load the rest
+_PROVIDER_MODULES = {
+    # Cloud/API providers
+    "OpenAITTS": ".openai",
+    "ElevenLabsTTS": ".elevenlabs",
+    "FishAudioTTS": ".fishaudio",
+    # Local models
+    "KokoroTTS": ".kokoro",
+    "GPTSovitsTTS": ".gptsovits",
+}
+
+def __getattr__(name: str):
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    provider = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = provider
+    return provider
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,22 +1,45 @@
 import os
-from typing import Generator, Any
+import functools
+from typing import AsyncGenerator, Generator, Any
 
 from ..base import TTSProvider
 from ..audio import AudioData
+from .._chunking import STREAM_MAX_DELAY, coalesce_chunks, coalesce_chunks_async
+from ..cache import ResponseCache, cached_run, cached_stream
+
+@functools.lru_cache(maxsize=64)
+def _parse_output_format(output_format: str, default_sample_rate: int) -> tuple[str, int]:
+    """Parse output format string into format and sample rate."""
+    parts = output_format.split("_")
+    format_type = parts[0]
+    sample_rate = int(parts[1]) if len(parts) > 1 else default_sample_rate
+    return format_type, sample_rate
 
 class ElevenLabsTTS(TTSProvider):
     DEFAULT_SAMPLE_RATE = 22050
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        enable_cache: bool = False,
+        http_client: Any | None = None
+    ):
         """
         Initialize ElevenLabs TTS provider.
 
         Args:
             api_key: ElevenLabs API key. If None, will try to get from
             ELEVENLABS_API_KEY environment variable.
+
+            enable_cache: Whether to cache responses in memory and on disk.
+                Repeated requests with identical parameters skip synthesis
+
+            http_client: Optional httpx.Client to send requests through. Share
+                one client across providers to reuse its keep-alive connection
+                pool. If None, the SDK creates its own client
         """
         try:
-            from elevenlabs.client import ElevenLabs
+            from elevenlabs.client import ElevenLabs, AsyncElevenLabs
         except ImportError:
             raise ImportError(
                 "ElevenLabs is not installed. Install with: "
@@ -29,19 +52,39 @@ class ElevenLabsTTS(TTSProvider):
                 "ElevenLabs API key is required. Provide it via the api_key parameter "
                 "or set the ELEVENLABS_API_KEY environment variable."
             )
-        self.client = ElevenLabs(api_key=api_key)
-        self.current_sample_rate = self.DEFAULT_SAMPLE_RATE
+        self.client = ElevenLabs(api_key=api_key, httpx_client=http_client)
+        self.async_client = AsyncElevenLabs(api_key=api_key)
+        self.cache = ResponseCache() if enable_cache else None
+
+    def get_sample_rate(self, response_format: str | None = None) -> int:
+        """
+        Get the sample rate of the audio output.
+
+        Args:
+            response_format: Output format as "codec_samplerate". If None or
+                without a sample rate, returns DEFAULT_SAMPLE_RATE
 
-    def get_sample_rate(self) -> int:
-        return self.current_sample_rate
+        Returns:
+            Sample rate in Hz
+        """
+        if response_format is None:
+            return self.DEFAULT_SAMPLE_RATE
+        return _parse_output_format(response_format, self.DEFAULT_SAMPLE_RATE)[1]
+
+    @staticmethod
+    def _pop_voice_settings(kwargs: dict[str, Any]) -> Any:
+        """Pop the voice settings parameters from kwargs into a VoiceSettings object."""
+        from elevenlabs.types.voice_settings import VoiceSettings
 
-    def _parse_output_format(self, output_format: str) -> tuple[str, int]:
-        """Parse output format string into format and sample rate."""
-        parts = output_format.split("_")
-        format_type = parts[0]
-        sample_rate = int(parts[1]) if len(parts) > 1 else self.current_sample_rate
-        return format_type, sample_rate
+        return VoiceSettings(
+            stability=kwargs.pop("stability", 0.5),
+            use_speaker_boost=kwargs.pop("use_speaker_boost", True),
+            similarity_boost=kwargs.pop("similarity_boost", 0.75),
+            style=kwargs.pop("style", 0.0),
+            speed=kwargs.pop("speed", 1.0),
+        )
 
+    @cached_run
     def run(
         self,
         text: str,
@@ -91,15 +134,7 @@ class ElevenLabsTTS(TTSProvider):
             >>> tts = ElevenLabsTTS()
             >>> audio = tts.run("Hello world")
         """
-        from elevenlabs.types.voice_settings import VoiceSettings
-        
-        voice_settings = VoiceSettings(
-            stability=kwargs.pop("stability", 0.5),
-            use_speaker_boost=kwargs.pop("use_speaker_boost", True),
-            similarity_boost=kwargs.pop("similarity_boost", 0.75),
-            style=kwargs.pop("style", 0.0),
-            speed=kwargs.pop("speed", 1.0),
-        )
+        voice_settings = self._pop_voice_settings(kwargs)
 
         response = self.client.text_to_speech.convert(
             text=text,
@@ -110,17 +145,23 @@ class ElevenLabsTTS(TTSProvider):
             **kwargs,
         )
 
-        data = b"".join(response)
-        encoded_format, sample_rate = self._parse_output_format(response_format)
-        self.current_sample_rate = sample_rate
+        # Grow a single buffer rather than holding every chunk until a join
+        buffer = bytearray()
+        extend = buffer.extend
+        for chunk in response:
+            extend(chunk)
+        data = bytes(buffer)
+        encoded_format, sample_rate = _parse_output_format(response_format, self.DEFAULT_SAMPLE_RATE)
         return AudioData(data, sample_rate, encoded_format)
 
+    @cached_stream
     def stream(
         self,
         text: str,
         voice_id: str = "JBFqnCBsd6RMkjVDRZzb",
         model_id: str = "eleven_multilingual_v2",
         response_format: str = "pcm_22050",
+        chunk_size_bytes: int | None = 8192,
         **kwargs: Any,
     ) -> Generator[AudioData, None, None]:
         """
@@ -139,6 +180,12 @@ class ElevenLabsTTS(TTSProvider):
             response_format: Output format as "codec_samplerate". Examples:
                 "pcm_22050", "pcm_44100": Uncompressed PCM audio
                 "mp3_22050_32", "mp3_44100_192": MP3 with bitrate
+
+            chunk_size_bytes: Minimum size of yielded chunks. Small network
+                chunks are merged until this size is reached, or until audio
+                has been held back for STREAM_MAX_DELAY seconds, and PCM chunks
+                always hold whole samples. None yields chunks as received.
+                Default: 8192
             
             **kwargs: Additional parameters. Common parameters:
                 stability: Voice stability and randomness, 0.0-1.0 (default: 0.5).
@@ -165,15 +212,7 @@ class ElevenLabsTTS(TTSProvider):
             >>> for chunk in tts.stream("Hello world"):
             ...     print(chunk)
         """
-        from elevenlabs.types.voice_settings import VoiceSettings
-
-        voice_settings = VoiceSettings(
-            stability=kwargs.pop("stability", 0.5),
-            use_speaker_boost=kwargs.pop("use_speaker_boost", True),
-            similarity_boost=kwargs.pop("similarity_boost", 0.75),
-            style=kwargs.pop("style", 0.0),
-            speed=kwargs.pop("speed", 1.0),
-        )
+        voice_settings = self._pop_voice_settings(kwargs)
 
         response = self.client.text_to_speech.stream(
             text=text,
@@ -184,7 +223,52 @@ class ElevenLabsTTS(TTSProvider):
             **kwargs,
         )
 
-        encoded_format, sample_rate = self._parse_output_format(response_format)
-        self.current_sample_rate = sample_rate
+        encoded_format, sample_rate = _parse_output_format(response_format, self.DEFAULT_SAMPLE_RATE)
+        if chunk_size_bytes is not None:
+            frame_size = 2 if encoded_format == "pcm" else 1
+            response = coalesce_chunks(response, chunk_size_bytes, frame_size, STREAM_MAX_DELAY)
+
         for data in response:
             yield AudioData(data, sample_rate, encoded_format)
+
+    async def stream_async(
+        self,
+        text: str,
+        voice_id: str = "JBFqnCBsd6RMkjVDRZzb",
+        model_id: str = "eleven_multilingual_v2",
+        response_format: str = "pcm_22050",
+        chunk_size_bytes: int | None = 8192,
+        **kwargs: Any,
+    ) -> AsyncGenerator[AudioData, None]:
+        """
+        Stream speech generation from text using the async ElevenLabs client.
+
+        Takes the same parameters as stream(). Many streams can run on one
+        event loop without holding a thread each.
+
+        Yields:
+            AudioData objects containing chunks of generated audio
+
+        Example:
+            >>> tts = ElevenLabsTTS()
+            >>> async for chunk in tts.stream_async("Hello world"):
+            ...     print(chunk)
+        """
+        voice_settings = self._pop_voice_settings(kwargs)
+
+        response = self.async_client.text_to_speech.stream(
+            text=text,
+            voice_id=voice_id,
+            model_id=model_id,
+            output_format=response_format,
+            voice_settings=voice_settings,
+            **kwargs,
+        )
+
+        encoded_format, sample_rate = _parse_output_format(response_format, self.DEFAULT_SAMPLE_RATE)
+        if chunk_size_bytes is not None:
+            frame_size = 2 if encoded_format == "pcm" else 1
+            response = coalesce_chunks_async(response, chunk_size_bytes, frame_size, STREAM_MAX_DELAY)
+
+        async for data in response:
+            yield AudioData(data, sample_rate, encoded_format)
@@ -1,23 +1,34 @@
 import os
-from typing import Generator, Any
+from typing import AsyncGenerator, Generator, Any
 
 from ..base import TTSProvider
 from ..audio import AudioData
+from .._chunking import (
+    STREAM_MAX_DELAY,
+    align_chunks,
+    align_chunks_async,
+    coalesce_chunks,
+    coalesce_chunks_async,
+)
+from ..cache import ResponseCache, cached_run, cached_stream
 from ..constants import EncodedBytesFormat
 
 class FishAudioTTS(TTSProvider):
     SAMPLE_RATE = 44100
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, enable_cache: bool = False):
         """
         Initialize Fish Audio TTS provider.
 
         Args:
             api_key: Fish Audio API key. If None, will try to get from
             FISHAUDIO_API_KEY environment variable.
+
+            enable_cache: Whether to cache responses in memory and on disk.
+                Repeated requests with identical parameters skip synthesis
         """
         try:
-            from fish_audio_sdk import Session
+            from fish_audio_sdk import Session, TTSRequest, Prosody
         except ImportError:
             raise ImportError(
                 "FishAudio is not installed. Install with: "
@@ -31,10 +42,25 @@ class FishAudioTTS(TTSProvider):
                 "or set the FISHAUDIO_API_KEY environment variable."
             )
         self.client = Session(apikey=api_key)
+        self._TTSRequest = TTSRequest
+        self._Prosody = Prosody
+        self._default_prosody = Prosody(speed=1.0, volume=0.0)
+        self.cache = ResponseCache() if enable_cache else None
+        self.sample_rate = self.SAMPLE_RATE
 
     def get_sample_rate(self) -> int:
-        return self.SAMPLE_RATE
+        return self.sample_rate
+
+    def _pop_prosody(self, kwargs: dict[str, Any]) -> Any:
+        """Pop speed and volume from kwargs, reusing the default Prosody when neither is set."""
+        if "speed" not in kwargs and "volume" not in kwargs:
+            return self._default_prosody
+        return self._Prosody(
+            speed=kwargs.pop("speed", 1.0),
+            volume=kwargs.pop("volume", 0.0)
+        )
 
+    @cached_run
     def run(
         self,
         text: str,
@@ -69,18 +95,13 @@ class FishAudioTTS(TTSProvider):
             >>> tts = FishAudioTTS()
             >>> audio = tts.run("Hello world")
         """
-        from fish_audio_sdk import TTSRequest, Prosody
-
         if references is None:
             references = []
 
-        prosody = Prosody(
-            speed=kwargs.pop("speed", 1.0),
-            volume=kwargs.pop("volume", 0.0)
-        )
+        prosody = self._pop_prosody(kwargs)
 
-        sample_rate = self.get_sample_rate()
-        response = self.client.tts(TTSRequest(
+        sample_rate = self.sample_rate
+        response = self.client.tts(self._TTSRequest(
             text=text,
             format=response_format,
             reference_id=reference_id,
@@ -89,15 +110,22 @@ class FishAudioTTS(TTSProvider):
             **kwargs
         ))
 
-        data = b"".join(response)
+        # Grow a single buffer rather than holding every chunk until a join
+        buffer = bytearray()
+        extend = buffer.extend
+        for chunk in response:
+            extend(chunk)
+        data = bytes(buffer)
         return AudioData(data, sample_rate, response_format)
 
+    @cached_stream
     def stream(
         self,
         text: str,
         reference_id: str | None = None,
         references: list | None = None,
         response_format: EncodedBytesFormat = "pcm",
+        chunk_size_bytes: int | None = 8192,
         **kwargs: Any
     ) -> Generator[AudioData, None, None]:
         """
@@ -111,6 +139,11 @@ class FishAudioTTS(TTSProvider):
             references: List of ReferenceAudio objects for custom voice cloning
             
             response_format: Output audio format: pcm, mp3, wav
+
+            chunk_size_bytes: Minimum size of yielded chunks. Small network
+                chunks are merged until this size is reached, or until audio
+                has been held back for STREAM_MAX_DELAY seconds. None yields
+                chunks as received. Default: 8192
             
             **kwargs: Additional parameters
                 speed: Speech speed multiplier. Default: 1.0
@@ -127,18 +160,13 @@ class FishAudioTTS(TTSProvider):
             >>> for chunk in tts.stream("Hello world"):
             ...     print(chunk)
         """
-        from fish_audio_sdk import TTSRequest, Prosody
-
         if references is None:
             references = []
 
-        prosody = Prosody(
-            speed=kwargs.pop("speed", 1.0),
-            volume=kwargs.pop("volume", 0.0)
-        )
+        prosody = self._pop_prosody(kwargs)
 
-        sample_rate = self.get_sample_rate()
-        response = self.client.tts(TTSRequest(
+        sample_rate = self.sample_rate
+        response = self.client.tts(self._TTSRequest(
             text=text,
             format=response_format,
             sample_rate=sample_rate,
@@ -148,19 +176,59 @@ class FishAudioTTS(TTSProvider):
             **kwargs
         ))
 
-        buffer = b""
-        for data in response:
-            combined = buffer + data
+        # Keep chunks on whole int16 samples
+        if chunk_size_bytes is None:
+            chunks = align_chunks(response)
+        else:
+            chunks = coalesce_chunks(response, chunk_size_bytes, 2, STREAM_MAX_DELAY)
 
-            if len(combined) % 2 == 1:
-                buffer = combined[-1:]
-                combined = combined[:-1]
-            else:
-                buffer = b""
+        for data in chunks:
+            yield AudioData(data, sample_rate, response_format)
+
+    async def stream_async(
+        self,
+        text: str,
+        reference_id: str | None = None,
+        references: list | None = None,
+        response_format: EncodedBytesFormat = "pcm",
+        chunk_size_bytes: int | None = 8192,
+        **kwargs: Any
+    ) -> AsyncGenerator[AudioData, None]:
+        """
+        Stream speech generation from text using the async Fish Audio client.
+
+        Takes the same parameters as stream(). Many streams can run on one
+        event loop without holding a thread each.
+
+        Yields:
+            AudioData objects containing chunks of generated audio
+
+        Example:
+            >>> tts = FishAudioTTS()
+            >>> async for chunk in tts.stream_async("Hello world"):
+            ...     print(chunk)
+        """
+        if references is None:
+            references = []
+
+        prosody = self._pop_prosody(kwargs)
+
+        sample_rate = self.sample_rate
+        response = self.client.tts.awaitable(self._TTSRequest(
+            text=text,
+            format=response_format,
+            sample_rate=sample_rate,
+            reference_id=reference_id,
+            references=references,
+            prosody=prosody,
+            **kwargs
+        ))
 
-            if len(combined) > 0:
-                yield AudioData(combined, sample_rate, response_format)
+        # Keep chunks on whole int16 samples
+        if chunk_size_bytes is None:
+            chunks = align_chunks_async(response)
+        else:
+            chunks = coalesce_chunks_async(response, chunk_size_bytes, 2, STREAM_MAX_DELAY)
 
-        if buffer:
-            buffer += b"\x00"
-            yield AudioData(buffer, sample_rate, response_format)
+        async for data in chunks:
+            yield AudioData(data, sample_rate, response_format)
@@ -1,18 +1,39 @@
+import warnings
+import functools
+import threading
 from pathlib import Path
 from typing import Generator, Any
 
 from ..base import TTSProvider
 from ..audio import AudioData
+from ..cache import ResponseCache, cached_run, cached_stream
 
 root_dir = Path(__file__).parent.parent
 
+@functools.lru_cache(maxsize=None)
+def _default_ref_audio_path(text_lang: str) -> str:
+    """
+    Get the absolute path of the bundled reference audio for a language.
+
+    GPT-SoVITS keeps the last reference audio loaded and only decodes a new
+    one when the path changes, so returning the same string on every call
+    keeps the default reference cached in the model. The "all_" language
+    variants share the reference of their base language.
+    """
+    text_lang = text_lang.removeprefix("all_")
+    return str((root_dir / "audio" / f"default_{text_lang}.mp3").resolve())
+
 class GPTSovitsTTS(TTSProvider):
+    MAX_CONCURRENCY = 1
+
     def __init__(
         self,
         model_version: str = "v2ProPlus",
-        is_half: bool = False,
+        is_half: bool | None = None,
         device: str | None = None,
-        warmup_model: bool = False
+        warmup_model: bool = False,
+        enable_cache: bool = False,
+        compile_model: bool = False
     ):
         """
         Initialize GPT-SoVITS TTS provider.
@@ -21,11 +42,22 @@ class GPTSovitsTTS(TTSProvider):
             model_version: Model version to use. Options:
                 "v2ProPlus", "v2Pro", "v2", "v1", "v3", "v4"
             
-            is_half: Whether to use half precision.
+            is_half: Whether to use half precision. If None, uses half precision on CUDA
+                and full precision otherwise.
             
             device: Device to run the model on. If None, uses "cuda" if available, otherwise "cpu".
             
-            warmup_model: Whether to warmup the model. Faster inference on consecutive calls
+            warmup_model: Whether to warmup the model. Faster inference on consecutive calls.
+                Warmup runs in a background thread; use wait_ready() to block until it finishes.
+                A failed warmup is raised from wait_ready(), run() and stream()
+
+            enable_cache: Whether to cache responses in memory and on disk.
+                Repeated requests with identical parameters skip synthesis
+
+            compile_model: Whether to compile the text-to-semantic decoding loop
+                (infer_panel) with torch.compile. The first calls are slower while
+                graphs are captured, later calls have less per-step overhead.
+                Ignored with a warning on torch versions without torch.compile
         """
         try:
             from GPT_SoVITS.TTS_infer_pack.TTS import TTS, TTS_Config
@@ -39,17 +71,75 @@ class GPTSovitsTTS(TTSProvider):
 
         version_configs = TTS_Config.default_configs[model_version].copy()
 
-        version_configs["device"] = device or torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        version_configs["is_half"] = is_half
+        device = torch.device(device or ("cuda" if torch.cuda.is_available() else "cpu"))
+        version_configs["device"] = device
+        version_configs["is_half"] = device.type == "cuda" if is_half is None else is_half
 
         self.client = TTS(TTS_Config({"custom": version_configs}))
 
+        if compile_model:
+            # Inference calls infer_panel, never forward, so compiling the
+            # module itself would leave the decoding loop uncompiled
+            t2s = self.client.t2s_model.model
+            try:
+                t2s.infer_panel = torch.compile(t2s.infer_panel, mode="reduce-overhead")
+            except (AttributeError, RuntimeError) as e:
+                warnings.warn(f"torch.compile is not available, running uncompiled: {e}")
+
+        self.cache_config = {
+            "model_version": model_version,
+            "is_half": version_configs["is_half"],
+            "device": device.type,
+        }
+        self.cache = ResponseCache() if enable_cache else None
+
+        # Warm up in the background so constructing several providers overlaps
+        self._warmup_thread = None
+        self._warmup_error: BaseException | None = None
         if warmup_model:
-            self.run("Warming up...")
+            self._warmup_thread = threading.Thread(target=self._warmup, daemon=True)
+            self._warmup_thread.start()
+
+    def _warmup(self):
+        """Run one throwaway inference to initialize the model, storing any error for wait_ready()."""
+        try:
+            response = self.client.run({
+                "text": "Warming up...",
+                "text_lang": "en",
+                "ref_audio_path": _default_ref_audio_path("en"),
+                "return_fragment": False
+            })
+            next(response)
+        except BaseException as e:
+            self._warmup_error = e
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        Block until the background warmup has finished.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None waits indefinitely
+
+        Returns:
+            True if the model is ready, False if the timeout expired first
+
+        Raises:
+            RuntimeError: If the warmup inference failed. The original
+                exception is chained as its cause
+        """
+        if self._warmup_thread is None:
+            return True
+        self._warmup_thread.join(timeout)
+        if self._warmup_thread.is_alive():
+            return False
+        if self._warmup_error is not None:
+            raise RuntimeError("GPT-SoVITS warmup failed") from self._warmup_error
+        return True
 
     def get_sample_rate(self) -> int:
         return self.client.configs.sampling_rate
 
+    @cached_run
     def run(
         self,
         text: str,
@@ -93,7 +183,8 @@ class GPTSovitsTTS(TTSProvider):
             >>> audio = tts.run("Hello world")
         """
 
-        ref_audio_path = ref_audio_path or f"{root_dir}/audio/default_{text_lang}.mp3"
+        self.wait_ready()
+        ref_audio_path = ref_audio_path or _default_ref_audio_path(text_lang)
 
         inputs = {
             "text": text,
@@ -109,6 +200,7 @@ class GPTSovitsTTS(TTSProvider):
         sample_rate, data = next(response)
         return AudioData(data, sample_rate,"raw")
 
+    @cached_stream
     def stream(
         self,
         text: str,
@@ -152,7 +244,8 @@ class GPTSovitsTTS(TTSProvider):
             >>> for chunk in tts.stream("Hello world"):
             ...     print(chunk)
         """
-        ref_audio_path = ref_audio_path or f"{root_dir}/audio/default_{text_lang}.mp3"
+        self.wait_ready()
+        ref_audio_path = ref_audio_path or _default_ref_audio_path(text_lang)
 
         inputs = {
             "text": text,
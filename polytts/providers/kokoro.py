@@ -1,14 +1,26 @@
+import wave
 import numpy as np
-from typing import Generator, Any
+from pathlib import Path
+from typing import IO, Generator, Any
 
 from ..base import TTSProvider
 from ..audio import AudioData
+from ..codecs import AudioConverter
+from ..constants import DType
+from ..validation import AudioValidator
+from ..cache import ResponseCache, cached_run, cached_stream
 
 
 class KokoroTTS(TTSProvider):
     SAMPLE_RATE = 24000
+    MAX_CONCURRENCY = 1
 
-    def __init__(self, lang_code: str = "a", device: str | None = None):
+    def __init__(
+        self,
+        lang_code: str = "a",
+        device: str | None = None,
+        enable_cache: bool = False
+    ):
         """
         Initialize Kokoro TTS provider.
 
@@ -26,6 +38,9 @@ class KokoroTTS(TTSProvider):
             
             device: Device to run model on. Options: "cuda", "cpu", or
                 None for auto-detect
+
+            enable_cache: Whether to cache responses in memory and on disk.
+                Repeated requests with identical parameters skip synthesis
         """
         try:
             from kokoro import KPipeline
@@ -35,14 +50,19 @@ class KokoroTTS(TTSProvider):
             )
 
         self.client = KPipeline(lang_code=lang_code, device=device)
+        self.cache_config = {"lang_code": lang_code, "device": device}
+        self.cache = ResponseCache() if enable_cache else None
+        self.sample_rate = self.SAMPLE_RATE
 
     def get_sample_rate(self) -> int:
-        return self.SAMPLE_RATE
+        return self.sample_rate
 
+    @cached_run
     def run(
         self,
         text: str,
         voice: str = "af_heart",
+        target_dtype: DType = "float32",
         **kwargs: Any
     ) -> AudioData:
         """
@@ -54,6 +74,10 @@ class KokoroTTS(TTSProvider):
             
             voice: Voice identifier to use. Common voices:
                 "af_heart", "af_bella", "af_jessica", "af_sarah", "am_adam", "am_michael"
+
+            target_dtype: Sample dtype of the returned audio. Use "int16" to
+                halve the size of the audio held and passed downstream.
+                Default: "float32"
             
             **kwargs: Additional parameters. Common parameters:
                 speed: Speech speed multiplier. Default: 1.0
@@ -69,26 +93,37 @@ class KokoroTTS(TTSProvider):
             >>> tts = KokoroTTS()
             >>> audio = tts.run("Hello world")
         """
+        AudioValidator.validate_target_dtype(target_dtype)
+        dtype = np.dtype(target_dtype)
+
         response = self.client(
             text=text,
             voice=voice,
             **kwargs
         )
 
-        audio_chunks = [audio.numpy() for _, _, audio in response]
+        # Kokoro returns CPU tensors, so .numpy() is a view and, for float32,
+        # the concatenate below is the only copy of the waveform. Narrower
+        # dtypes are converted per chunk so the concatenate moves fewer bytes
+        audio_chunks = [
+            AudioConverter._convert_to_dtype(audio.numpy(), dtype)
+            for _, _, audio in response
+        ]
 
         audio = (
             np.concatenate(audio_chunks)
             if audio_chunks
-            else np.array([], dtype=np.float32)
+            else np.array([], dtype=dtype)
         )
 
-        return AudioData(audio, self.get_sample_rate(), "raw")
+        return AudioData(audio, self.sample_rate, "raw")
 
+    @cached_stream
     def stream(
         self,
         text: str,
         voice: str = "af_heart",
+        target_dtype: DType = "float32",
         **kwargs: Any
     ) -> Generator[AudioData, None, None]:
         """
@@ -100,6 +135,10 @@ class KokoroTTS(TTSProvider):
             
             voice: Voice identifier to use. Common voices:
                 "af_heart", "af_bella", "af_jessica", "af_sarah", "am_adam", "am_michael"
+
+            target_dtype: Sample dtype of the returned audio. Use "int16" to
+                halve the size of the audio held and passed downstream.
+                Default: "float32"
             
             **kwargs: Additional parameters. Common parameters:
                 speed: Speech speed multiplier. Default: 1.0
@@ -116,11 +155,68 @@ class KokoroTTS(TTSProvider):
             >>> for chunk in tts.stream("Hello world"):
             ...     print(chunk)
         """
+        AudioValidator.validate_target_dtype(target_dtype)
+        dtype = np.dtype(target_dtype)
+
         response = self.client(
             text=text,
             voice=voice,
             **kwargs
         )
 
+        sample_rate = self.sample_rate
         for _, _, audio in response:
-            yield AudioData(audio.numpy(), self.get_sample_rate(), "raw")
+            # Model output is always a non-empty raw array, skip validation
+            yield AudioData._unchecked(
+                AudioConverter._convert_to_dtype(audio.numpy(), dtype),
+                sample_rate,
+                "raw"
+            )
+
+    def run_to_wav(
+        self,
+        text: str,
+        out: str | Path | IO[bytes],
+        voice: str = "af_heart",
+        **kwargs: Any
+    ) -> float:
+        """
+        Generate speech from text and write it straight to a WAV file.
+
+        Each chunk is converted to int16 and written as it is generated, so
+        the full utterance is never held in memory or concatenated.
+
+        Args:
+            text: The text to convert to speech
+
+            out: Path or writable binary file object to write the WAV to
+
+            voice: Voice identifier to use
+
+            **kwargs: Additional parameters, as for run()
+
+        Returns:
+            Duration of the written audio in seconds
+
+        Example:
+            >>> tts = KokoroTTS()
+            >>> tts.run_to_wav("Hello world", "hello.wav")
+        """
+        response = self.client(
+            text=text,
+            voice=voice,
+            **kwargs
+        )
+
+        sample_rate = self.sample_rate
+        num_samples = 0
+        with wave.open(str(out) if isinstance(out, Path) else out, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            for _, _, audio in response:
+                samples = AudioConverter._numpy_to_int16(audio.numpy())
+                wav_file.writeframes(samples)
+                num_samples += samples.size
+
+        return num_samples / sample_rate
@@ -3,18 +3,32 @@ from typing import Generator, Any
 
 from ..base import TTSProvider
 from ..audio import AudioData
+from .._chunking import STREAM_MAX_DELAY, align_chunks, coalesce_chunks
+from ..cache import ResponseCache, cached_run, cached_stream
 from ..constants import EncodedBytesFormat
 
 class OpenAITTS(TTSProvider):
     SAMPLE_RATE = 24000
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        enable_cache: bool = False,
+        http_client: Any | None = None
+    ):
         """
         Initialize OpenAI TTS provider.
 
         Args:
             api_key: OpenAI API key. If None, will try to get from
             OPENAI_API_KEY environment variable.
+
+            enable_cache: Whether to cache responses in memory and on disk.
+                Repeated requests with identical parameters skip synthesis
+
+            http_client: Optional httpx.Client to send requests through. Share
+                one client across providers to reuse its keep-alive connection
+                pool. If None, the SDK creates its own client
         """
         try:
             from openai import OpenAI
@@ -30,11 +44,14 @@ class OpenAITTS(TTSProvider):
                 "OpenAI API key is required. Provide it via the api_key parameter "
                 "or set the OPENAI_API_KEY environment variable."
             )
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=http_client)
+        self.cache = ResponseCache() if enable_cache else None
+        self.sample_rate = self.SAMPLE_RATE
 
     def get_sample_rate(self) -> int:
-        return self.SAMPLE_RATE
+        return self.sample_rate
 
+    @cached_run
     def run(
         self,
         text: str,
@@ -79,15 +96,17 @@ class OpenAITTS(TTSProvider):
         )
 
         data = response.content
-        sample_rate = self.get_sample_rate()
+        sample_rate = self.sample_rate
         return AudioData(data, sample_rate, response_format)
 
+    @cached_stream
     def stream(
         self,
         text: str,
         voice: str = "alloy",
         model: str = "tts-1",
         response_format: EncodedBytesFormat = "pcm",
+        chunk_size_bytes: int | None = 8192,
         **kwargs: Any
     ) -> Generator[AudioData, None, None]:
         """
@@ -102,6 +121,11 @@ class OpenAITTS(TTSProvider):
             model: Model to use. Options: tts-1, tts-1-hd, gpt-4o-mini-tts
             
             response_format: Output audio format: pcm, mp3, wav
+
+            chunk_size_bytes: Minimum size of yielded chunks. Small network
+                chunks are merged until this size is reached, or until audio
+                has been held back for STREAM_MAX_DELAY seconds. None yields
+                chunks as received. Default: 8192
             
             **kwargs: Additional parameters. Common parameters:
                 speed: Speech speed, 0.25-4.0 (default: 1.0).
@@ -118,8 +142,7 @@ class OpenAITTS(TTSProvider):
             >>> for chunk in tts.stream("Hello world"):
             ...     print(chunk)
         """
-        sample_rate = self.get_sample_rate()
-        buffer = b""
+        sample_rate = self.sample_rate
 
         with self.client.audio.speech.with_streaming_response.create(
             input=text,
@@ -128,19 +151,11 @@ class OpenAITTS(TTSProvider):
             response_format=response_format,
             **kwargs
         ) as response:
-            for data in response.iter_bytes():
-                # Ensure we have even number of bytes
-                combined = buffer + data
-
-                if len(combined) % 2 == 1:
-                    buffer = combined[-1:]
-                    combined = combined[:-1]
-                else:
-                    buffer = b""
-
-                if len(combined) > 0:
-                    yield AudioData(combined, sample_rate, response_format)
-
-            if buffer:
-                buffer += b"\x00"
-                yield AudioData(buffer, sample_rate, response_format)
+            # Keep chunks on whole int16 samples
+            if chunk_size_bytes is None:
+                chunks = align_chunks(response.iter_bytes())
+            else:
+                chunks = coalesce_chunks(response.iter_bytes(), chunk_size_bytes, 2, STREAM_MAX_DELAY)
+
+            for data in chunks:
+                yield AudioData(data, sample_rate, response_format)
@@ -1,7 +1,24 @@
 import numpy as np
 from typing import get_args
 
-from .constants import EncodedBytesFormat, AudioFormat, DType
+from .constants import EncodedBytesFormat, AudioFormat, DType, ByteOrder
+
+# Resolved once at import, validation runs on every AudioData construction
+_BYTES_FORMATS = get_args(EncodedBytesFormat)
+_AUDIO_FORMATS = get_args(AudioFormat)
+_DTYPES = get_args(DType)
+_BYTE_ORDERS = get_args(ByteOrder)
+_BYTES_FORMAT_SET = frozenset(_BYTES_FORMATS)
+_AUDIO_FORMAT_SET = frozenset(_AUDIO_FORMATS)
+_DTYPE_SET = frozenset(_DTYPES)
+_BYTE_ORDER_SET = frozenset(_BYTE_ORDERS)
+
+def _is_member(value: object, valid: frozenset) -> bool:
+    """Check set membership, treating unhashable values as invalid."""
+    try:
+        return value in valid
+    except TypeError:
+        return False
 
 class AudioValidator:
     """Shared validation logic for audio conversion."""
@@ -9,13 +26,21 @@ class AudioValidator:
     @staticmethod
     def validate_data(data: bytes | np.ndarray):
         """Validate that data is bytes or numpy array and not empty."""
-        if not isinstance(data, (bytes, np.ndarray)):
+        data_type = type(data)
+        # Exact types are the common case, only subclasses need isinstance
+        if data_type is not bytes and data_type is not np.ndarray and not isinstance(data, (bytes, np.ndarray)):
             raise TypeError(
                 f"Data must be bytes or numpy array, got {type(data).__name__}"
             )
         
         if len(data) == 0:
             raise ValueError("Data must not be empty")
+
+        # Only integer and float samples can be scaled between dtypes
+        if isinstance(data, np.ndarray) and data.dtype.kind not in "iuf":
+            raise ValueError(
+                f"Numpy data must have an integer or float dtype, got {data.dtype}"
+            )
     
     @staticmethod
     def validate_sample_rate(sample_rate: int):
@@ -31,21 +56,47 @@ class AudioValidator:
     @staticmethod
     def validate_output_format(output_format: str):
         """Validate that output_format is one of the supported byte formats."""
-        if output_format not in get_args(EncodedBytesFormat):
+        if not _is_member(output_format, _BYTES_FORMAT_SET):
             raise ValueError(
                 f"Invalid output format: {output_format}. "
-                f"Valid formats are: {get_args(EncodedBytesFormat)}"
+                f"Valid formats are: {_BYTES_FORMATS}"
             )
     
     @staticmethod
     def validate_target_dtype(target_dtype: str):
         """Validate that target_dtype is one of the supported types."""
-        if target_dtype not in get_args(DType):
+        if not _is_member(target_dtype, _DTYPE_SET):
             raise ValueError(
                 f"Invalid target dtype: {target_dtype}. "
-                f"Valid dtypes are: {get_args(DType)}"
+                f"Valid dtypes are: {_DTYPES}"
             )
     
+    @staticmethod
+    def validate_out_array(out: np.ndarray, target_dtype: str, shape: tuple[int, ...]):
+        """Validate a preallocated output array for a conversion."""
+        if not isinstance(out, np.ndarray):
+            raise TypeError(f"out must be a numpy array, got {type(out).__name__}")
+        if out.dtype != target_dtype:
+            raise ValueError(f"out has dtype {out.dtype}, expected {target_dtype}")
+        if out.shape != shape:
+            raise ValueError(f"out has shape {out.shape}, expected {shape}")
+        if not out.flags.writeable:
+            raise ValueError("out must be writeable")
+
+    @staticmethod
+    def validate_byteorder(byteorder: str, output_format: str):
+        """Validate byteorder, which only pcm output can change."""
+        if not _is_member(byteorder, _BYTE_ORDER_SET):
+            raise ValueError(
+                f"Invalid byteorder: {byteorder}. "
+                f"Valid byte orders are: {_BYTE_ORDERS}"
+            )
+
+        if output_format != "pcm" and byteorder == "big":
+            raise ValueError(
+                f"{output_format} output is always little-endian, only pcm supports byteorder='big'"
+            )
+
     @staticmethod
     def validate_encoded_format_for_data(data: bytes | np.ndarray, encoded_format: str):
         """
@@ -53,8 +104,8 @@ class AudioValidator:
         
         Used by AudioData to ensure numpy arrays use 'raw' and bytes use valid byte formats.
         """
-        is_numpy = isinstance(data, np.ndarray)
-        is_bytes = isinstance(data, bytes)
+        is_numpy = type(data) is np.ndarray or isinstance(data, np.ndarray)
+        is_bytes = not is_numpy and isinstance(data, bytes)
         
         if is_numpy and encoded_format != "raw":
             raise ValueError(
@@ -62,21 +113,20 @@ class AudioValidator:
                 f"The only valid format is 'raw'"
             )
         
-        if is_bytes and encoded_format not in get_args(EncodedBytesFormat):
+        if is_bytes and not _is_member(encoded_format, _BYTES_FORMAT_SET):
             raise ValueError(
                 f"Invalid encoded format for bytes: {encoded_format}. "
-                f"Valid formats are: {get_args(EncodedBytesFormat)}"
+                f"Valid formats are: {_BYTES_FORMATS}"
             )
     
     @staticmethod
     def validate_encoded_format(encoded_format: str):
         """
         Validate that encoded_format is a supported audio format."""
-        valid_formats = get_args(AudioFormat)
-        if encoded_format not in valid_formats:
+        if not _is_member(encoded_format, _AUDIO_FORMAT_SET):
             raise ValueError(
                 f"Invalid encoded format: {encoded_format}. "
-                f"Valid formats are: {valid_formats}"
+                f"Valid formats are: {_AUDIO_FORMATS}"
             )
 
     @staticmethod
@@ -7,8 +7,9 @@ from polytts.codecs import AudioConverter
 def test_audio_data() -> tuple[int, dict]:
     """Generate test audio data for all formats."""
     sample_rate = 22050
-    # Exactly 1 second of audio
-    audio = np.random.randint(-32768, 32768, size=sample_rate, dtype=np.int16)
+    # Exactly 1 second of a 440 Hz tone, deterministic and cheap to MP3 encode
+    t = np.arange(sample_rate, dtype=np.float32)
+    audio = (np.sin(2 * np.pi * 440 * t / sample_rate) * 16000).astype(np.int16)
 
     audio_formats = {
         "raw": audio,
@@ -17,4 +18,13 @@ def test_audio_data() -> tuple[int, dict]:
         "mp3": AudioConverter.to_bytes(audio, sample_rate, "raw", "mp3"),
     }
 
-    return sample_rate, audio_formats
\ No newline at end of file
+    return sample_rate, audio_formats
+
+@pytest.fixture(scope="session")
+def decoded_int16(test_audio_data: tuple[int, dict]) -> dict[str, np.ndarray]:
+    """Decode every test audio format to int16 once per session."""
+    _, audio_formats = test_audio_data
+    return {
+        encoded_format: AudioConverter.to_numpy(audio, encoded_format, "int16")
+        for encoded_format, audio in audio_formats.items()
+    }
@@ -1,16 +1,22 @@
+import io
+import wave
 import pytest
 import numpy as np
 from typing import Any
 
-from polytts.audio import AudioData
+from polytts.audio import AudioData, PCMStreamBuffer
 from polytts.constants import AudioFormat
 
+# Shared by tests that only need a small valid array, read-only so none can mutate it
+_TINY_INT16 = np.array([1, 2, 3], dtype=np.int16)
+_TINY_INT16.flags.writeable = False
+
 class TestAudioDataInit:
     """Test AudioData initialization."""
 
     def test_init_with_numpy_raw(self):
         """Test creating AudioData with numpy array."""
-        audio = np.array([1, 2, 3], dtype=np.int16)
+        audio = _TINY_INT16
         audio_data = AudioData(audio, 22050, "raw")
         
         assert audio_data.sample_rate == 22050
@@ -25,13 +31,35 @@ class TestAudioDataInit:
         assert audio_data.encoded_format == "pcm"
         assert audio_data.is_bytes
 
+    def test_fields_are_read_only(self):
+        """Test that fields cannot be reassigned after creation."""
+        audio_data = AudioData(b"12345678", 22050, "pcm")
+
+        with pytest.raises(AttributeError):
+            audio_data.data = b"87654321"
+        with pytest.raises(AttributeError):
+            audio_data.sample_rate = 44100
+        with pytest.raises(AttributeError):
+            audio_data.encoded_format = "wav"
+
+    def test_unchecked_matches_init(self):
+        """Test that the unchecked constructor sets the same fields."""
+        samples = _TINY_INT16
+        checked = AudioData(samples, 22050, "raw")
+        unchecked = AudioData._unchecked(samples, 22050, "raw")
+
+        assert unchecked.data is checked.data
+        assert unchecked.sample_rate == checked.sample_rate
+        assert unchecked.dtype == checked.dtype
+        assert unchecked.duration == checked.duration
+
 class TestAudioDataPostInitValidation:
     """Test AudioData post-initialization validation."""
 
     def test_format_mismatch(self):
         """Test that numpy must use 'raw' and bytes must use encoded formats."""
         with pytest.raises(ValueError):
-            AudioData(np.array([1, 2, 3]), 22050, "pcm")
+            AudioData(_TINY_INT16, 22050, "pcm")
         with pytest.raises(ValueError):
             AudioData(b"12345678", 22050, "raw")
 
@@ -49,7 +77,7 @@ class TestAudioDataPostInitValidation:
     def test_invalid_sample_rate(self, invalid_sample_rate: Any):
         """Test that invalid sample rates are rejected."""
         with pytest.raises((TypeError, ValueError)):
-            AudioData(np.array([1, 2, 3]), invalid_sample_rate, "raw")
+            AudioData(_TINY_INT16, invalid_sample_rate, "raw")
 
     @pytest.mark.parametrize("invalid_encoded_format", [
         "ogg", "flac", "", None, 123, [], {}, 1.0
@@ -57,14 +85,14 @@ class TestAudioDataPostInitValidation:
     def test_invalid_encoded_format(self, invalid_encoded_format: Any):
         """Test that invalid encoded formats are rejected."""
         with pytest.raises(ValueError):
-            AudioData(np.array([1, 2, 3]), 22050, invalid_encoded_format)
+            AudioData(_TINY_INT16, 22050, invalid_encoded_format)
 
 class TestAudioDataProperties:
     """Test AudioData properties."""
 
     def test_is_numpy(self):
         """Test that AudioData is numpy."""
-        audio = AudioData(np.array([1, 2, 3]), 22050, "raw")
+        audio = AudioData(_TINY_INT16, 22050, "raw")
         assert audio.is_numpy
         assert not audio.is_bytes
 
@@ -76,7 +104,7 @@ class TestAudioDataProperties:
 
     def test_dtype(self):
         """Test that AudioData dtype is correct."""
-        audio = AudioData(np.array([1, 2, 3], dtype=np.int16), 22050, "raw")
+        audio = AudioData(_TINY_INT16, 22050, "raw")
         assert audio.dtype == np.int16
 
     @pytest.mark.parametrize("encoded_format", [
@@ -101,4 +129,215 @@ class TestAudioDataProperties:
         if encoded_format == "mp3":
             assert audio.duration == pytest.approx(expected_duration, rel=0.1)
         else:
-            assert audio.duration == pytest.approx(expected_duration, rel=0.01)
\ No newline at end of file
+            assert audio.duration == pytest.approx(expected_duration, rel=0.01)
+
+    @staticmethod
+    def _stereo_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+        """Encode mono samples as a two channel WAV."""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(2)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(np.repeat(samples, 2).tobytes())
+        return buffer.getvalue()
+
+    def test_duration_stereo_wav(self, test_audio_data: tuple[int, dict]):
+        """Test that WAV duration counts frames, not samples, for stereo data."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(self._stereo_wav(audio_formats["raw"], sample_rate), sample_rate, "wav")
+
+        assert audio.duration == pytest.approx(1.0)
+
+    @pytest.mark.parametrize("encoded_format, declared_rate", [
+        ("wav", None),
+        ("stereo_wav", None),
+        ("mp3", None),
+        ("mp3", 44100),
+    ])
+    def test_duration_after_decode(
+        self,
+        test_audio_data: tuple[int, dict],
+        encoded_format: str,
+        declared_rate: int | None
+    ):
+        """Test that duration does not change once the audio has been decoded."""
+        sample_rate, audio_formats = test_audio_data
+        if encoded_format == "stereo_wav":
+            data, encoded_format = self._stereo_wav(audio_formats["raw"], sample_rate), "wav"
+        else:
+            data = audio_formats[encoded_format]
+        declared_rate = declared_rate or sample_rate
+
+        before = AudioData(data, declared_rate, encoded_format).duration
+        decoded = AudioData(data, declared_rate, encoded_format)
+        decoded.as_numpy("int16")
+
+        assert decoded.duration == pytest.approx(before)
+
+class TestAudioDataConversions:
+    """Test AudioData conversion methods."""
+
+    @pytest.mark.parametrize("encoded_format", ["raw", "pcm", "wav"])
+    def test_as_numpy_int16(
+        self,
+        test_audio_data: tuple[int, dict],
+        encoded_format: AudioFormat
+    ):
+        """Test that decoding to int16 recovers the original samples."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats[encoded_format], sample_rate, encoded_format)
+
+        np.testing.assert_array_equal(audio.as_numpy("int16"), audio_formats["raw"])
+
+    def test_wav_as_pcm_skips_decode(self, test_audio_data: tuple[int, dict]):
+        """Test that WAV to PCM slices the payload without decoding."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats["wav"], sample_rate, "wav")
+
+        assert audio.as_bytes("pcm") == audio_formats["pcm"]
+        assert audio._decoded is None
+
+    def test_decode_is_cached(self, test_audio_data: tuple[int, dict]):
+        """Test that repeated conversions reuse the decoded samples."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats["wav"], sample_rate, "wav")
+
+        pcm = audio.as_bytes("pcm")
+        decoded = audio._decoded_int16
+        audio.as_numpy("float32")
+
+        assert audio._decoded_int16 is decoded
+        assert pcm == audio_formats["pcm"]
+
+    @pytest.mark.parametrize("target_dtype", ["int16", "int32", "float16", "float32"])
+    def test_as_numpy_out(self, test_audio_data: tuple[int, dict], target_dtype: str):
+        """Test that as_numpy fills a preallocated output array."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats["pcm"], sample_rate, "pcm")
+        out = np.empty(len(audio_formats["raw"]), dtype=target_dtype)
+
+        result = audio.as_numpy(target_dtype, out=out)
+
+        assert result is out
+        np.testing.assert_array_equal(out, audio.as_numpy(target_dtype))
+
+    def test_as_numpy_invalid_out(self, test_audio_data: tuple[int, dict]):
+        """Test that mismatched output arrays are rejected."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats["pcm"], sample_rate, "pcm")
+        num_samples = len(audio_formats["raw"])
+
+        with pytest.raises(ValueError):
+            audio.as_numpy("float32", out=np.empty(num_samples, dtype=np.int16))
+        with pytest.raises(ValueError):
+            audio.as_numpy("float32", out=np.empty(num_samples - 1, dtype=np.float32))
+
+    @pytest.mark.parametrize("encoded_format", ["raw", "pcm", "wav"])
+    def test_as_bytes_big_endian(
+        self,
+        test_audio_data: tuple[int, dict],
+        encoded_format: AudioFormat
+    ):
+        """Test that big-endian PCM output swaps each sample."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats[encoded_format], sample_rate, encoded_format)
+
+        big = np.frombuffer(audio.as_bytes("pcm", byteorder="big"), dtype=">i2")
+
+        np.testing.assert_array_equal(big, audio_formats["raw"])
+        assert audio.as_bytes("pcm", byteorder="little") == audio_formats["pcm"]
+
+    def test_invalid_byteorder(self, test_audio_data: tuple[int, dict]):
+        """Test that only pcm output accepts big-endian byte order."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats["pcm"], sample_rate, "pcm")
+
+        with pytest.raises(ValueError):
+            audio.as_bytes("wav", byteorder="big")
+        with pytest.raises(ValueError):
+            audio.as_bytes("pcm", byteorder="middle")
+
+    @pytest.mark.parametrize("encoded_format", ["raw", "pcm", "wav"])
+    def test_asarray(
+        self,
+        test_audio_data: tuple[int, dict],
+        encoded_format: AudioFormat
+    ):
+        """Test that np.asarray returns the int16 samples."""
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats[encoded_format], sample_rate, encoded_format)
+
+        np.testing.assert_array_equal(np.asarray(audio), audio_formats["raw"])
+
+    @pytest.mark.parametrize("encoded_format", ["raw", "pcm", "wav"])
+    def test_as_memoryview(
+        self,
+        test_audio_data: tuple[int, dict],
+        encoded_format: AudioFormat
+    ):
+        """Test that as_memoryview exposes the stored bytes read-only."""
+        sample_rate, audio_formats = test_audio_data
+        data = audio_formats[encoded_format]
+        audio = AudioData(data, sample_rate, encoded_format)
+
+        view = audio.as_memoryview()
+
+        assert view.readonly
+        assert view.format == "B"
+        assert view.tobytes() == (data.tobytes() if encoded_format == "raw" else data)
+
+    def test_as_torch(self, test_audio_data: tuple[int, dict]):
+        """Test that as_torch matches as_numpy."""
+        torch = pytest.importorskip("torch")
+        sample_rate, audio_formats = test_audio_data
+        audio = AudioData(audio_formats["pcm"], sample_rate, "pcm")
+
+        tensor = audio.as_torch("float32")
+
+        assert tensor.dtype == torch.float32
+        np.testing.assert_array_equal(tensor.numpy(), audio.as_numpy("float32"))
+
+    def test_from_torch(self, test_audio_data: tuple[int, dict]):
+        """Test that from_torch wraps the tensor samples as raw audio."""
+        torch = pytest.importorskip("torch")
+        sample_rate, audio_formats = test_audio_data
+        tensor = torch.from_numpy(audio_formats["raw"].copy())
+
+        audio = AudioData.from_torch(tensor, sample_rate)
+
+        assert audio.encoded_format == "raw"
+        assert audio.as_bytes("pcm") == audio_formats["pcm"]
+
+class TestPCMStreamBuffer:
+    """Test PCMStreamBuffer accumulation."""
+
+    def test_append_and_finalize(self):
+        """Test that appended chunks are concatenated in order."""
+        chunks = [
+            _TINY_INT16,
+            np.array([4, 5], dtype=np.int16),
+        ]
+        buffer = PCMStreamBuffer()
+        for chunk in chunks:
+            buffer.append(AudioData(chunk, 22050, "raw"))
+
+        assert len(buffer) == 5
+        np.testing.assert_array_equal(buffer.finalize("int16"), np.concatenate(chunks))
+
+    def test_append_mixed_formats(self):
+        """Test that bytes and numpy chunks can be mixed."""
+        pcm = _TINY_INT16.tobytes()
+        buffer = PCMStreamBuffer()
+        buffer.append(AudioData(pcm, 22050, "pcm"))
+        buffer.append(AudioData(np.array([4], dtype=np.int16), 22050, "raw"))
+
+        np.testing.assert_array_equal(buffer.finalize("int16"), [1, 2, 3, 4])
+
+    @pytest.mark.parametrize("target_dtype", ["int16", "int32", "float16", "float32"])
+    def test_finalize_dtype(self, target_dtype: str):
+        """Test that finalize converts to the requested dtype."""
+        buffer = PCMStreamBuffer()
+        buffer.append(AudioData(_TINY_INT16, 22050, "raw"))
+
+        assert buffer.finalize(target_dtype).dtype == target_dtype
@@ -0,0 +1,97 @@
+import time
+import pytest
+import asyncio
+import threading
+from typing import Any, Generator
+
+from polytts.audio import AudioData
+from polytts.base import TTSProvider
+
+class SlowTTS(TTSProvider):
+    """Provider stub that sleeps per call and tracks peak concurrency."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get_sample_rate(self) -> int:
+        return 22050
+
+    def _enter(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _exit(self):
+        with self.lock:
+            self.active -= 1
+
+    def run(self, text: str, **kwargs: Any) -> AudioData:
+        self._enter()
+        time.sleep(0.02)
+        self._exit()
+        return AudioData(text.encode().ljust(2, b"\x00"), self.get_sample_rate(), "pcm")
+
+    def stream(self, text: str, **kwargs: Any) -> Generator[AudioData, None, None]:
+        self._enter()
+        for word in text.split():
+            time.sleep(0.01)
+            yield AudioData(word.encode().ljust(2, b"\x00"), self.get_sample_rate(), "pcm")
+        self._exit()
+
+class SerialTTS(SlowTTS):
+    MAX_CONCURRENCY = 1
+
+class TestBatch:
+    """Test the batch synthesis APIs."""
+
+    def test_run_batch_order(self):
+        """Test results come back in input order with bounded concurrency."""
+        tts = SlowTTS()
+        texts = [f"t{i}" for i in range(8)]
+        audios = tts.run_batch_sync(texts, concurrency=3)
+
+        assert [audio.data for audio in audios] == [text.encode() for text in texts]
+        assert 1 < tts.peak <= 3
+
+    def test_max_concurrency(self):
+        """Test providers can cap batch concurrency."""
+        tts = SerialTTS()
+        tts.run_batch_sync(["a1", "b2", "c3"], concurrency=8)
+
+        assert tts.peak == 1
+
+    def test_invalid_concurrency(self):
+        """Test non-positive concurrency is rejected."""
+        with pytest.raises(ValueError):
+            SlowTTS().run_batch_sync(["hi"], concurrency=0)
+
+    def test_stream_batch(self):
+        """Test chunks are tagged with their text index and keep their order."""
+        async def collect():
+            return [item async for item in SlowTTS().stream_batch(["aa bb", "cc dd ee"])]
+
+        items = asyncio.run(collect())
+        by_index = {0: [], 1: []}
+        for index, chunk in items:
+            by_index[index].append(chunk.data)
+
+        assert by_index == {0: [b"aa", b"bb"], 1: [b"cc", b"dd", b"ee"]}
+
+    def test_stream_async_default(self):
+        """Test the default stream_async yields the stream() chunks in order."""
+        async def collect():
+            return [chunk.data async for chunk in SlowTTS().stream_async("aa bb cc")]
+
+        assert asyncio.run(collect()) == [b"aa", b"bb", b"cc"]
+
+    def test_iter_batch(self):
+        """Test every result is yielded once, tagged with its text index."""
+        tts = SlowTTS()
+        texts = [f"t{i}" for i in range(6)]
+        results = dict(tts.iter_batch(texts, concurrency=3))
+
+        assert sorted(results) == list(range(6))
+        assert all(results[i].data == text.encode() for i, text in enumerate(texts))
+        assert 1 < tts.peak <= 3
@@ -0,0 +1,204 @@
+import os
+import threading
+import pytest
+import numpy as np
+from typing import Any, Generator
+
+from polytts.audio import AudioData
+from polytts.base import TTSProvider
+from polytts.cache import ResponseCache, cached_run, cached_stream
+
+class CountingTTS(TTSProvider):
+    """Provider stub that counts synthesis calls."""
+
+    def __init__(self, cache: ResponseCache | None, lang_code: str = "a"):
+        self.cache = cache
+        self.cache_config = {"lang_code": lang_code}
+        self.calls = 0
+
+    def get_sample_rate(self) -> int:
+        return 22050
+
+    @cached_run
+    def run(self, text: str, voice: str = "a", **kwargs: Any) -> AudioData:
+        self.calls += 1
+        return AudioData(text.encode() * 2, self.get_sample_rate(), "pcm")
+
+    @cached_stream
+    def stream(self, text: str, voice: str = "a", **kwargs: Any) -> Generator[AudioData, None, None]:
+        self.calls += 1
+        for word in text.split():
+            yield AudioData(np.full(4, len(word), dtype=np.float32), self.get_sample_rate(), "raw")
+
+class TestResponseCache:
+    """Test ResponseCache storage."""
+
+    def test_make_key(self):
+        """Test keys depend on provider and parameters, not their order."""
+        key = ResponseCache.make_key("OpenAITTS", text="hi", voice="alloy", speed=1.0)
+
+        assert key.startswith("OpenAITTS/")
+        assert key == ResponseCache.make_key("OpenAITTS", speed=1.0, voice="alloy", text="hi")
+        assert key != ResponseCache.make_key("OpenAITTS", text="hi", voice="echo", speed=1.0)
+        assert key != ResponseCache.make_key("KokoroTTS", text="hi", voice="alloy", speed=1.0)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted."""
+        cache = ResponseCache(max_entries=2, persist=False)
+        chunks = [AudioData(b"\x00\x00", 22050, "pcm")]
+
+        cache.put("a", chunks)
+        cache.put("b", chunks)
+        cache.get("a")
+        cache.put("c", chunks)
+
+        assert cache.get("a") is chunks
+        assert cache.get("b") is None
+        assert cache.get("c") is chunks
+
+    def test_persistence(self, tmp_path):
+        """Test entries are reloaded from disk by a new cache."""
+        chunks = [
+            AudioData(np.arange(4, dtype=np.int16), 24000, "raw"),
+            AudioData(np.arange(4, 10, dtype=np.int16), 24000, "raw"),
+        ]
+        ResponseCache(cache_dir=tmp_path).put("KokoroTTS/key", chunks)
+
+        loaded = ResponseCache(cache_dir=tmp_path).get("KokoroTTS/key")
+
+        assert len(loaded) == 2
+        for original, restored in zip(chunks, loaded):
+            assert restored.sample_rate == 24000
+            assert restored.encoded_format == "raw"
+            np.testing.assert_array_equal(restored.data, original.data)
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test expired entries are treated as misses."""
+        cache = ResponseCache(cache_dir=tmp_path, ttl=-1)
+        cache.put("key", [AudioData(b"\x00\x00", 22050, "pcm")])
+
+        assert cache.get("key") is None
+        assert not list(tmp_path.glob("key.*"))
+
+    def test_clear_disk(self, tmp_path):
+        """Test clear(disk=True) also empties the on-disk store."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.put("KokoroTTS/key", [AudioData(b"\x00\x00", 22050, "pcm")])
+
+        cache.clear()
+        assert ResponseCache(cache_dir=tmp_path).get("KokoroTTS/key") is not None
+
+        cache.clear(disk=True)
+        assert ResponseCache(cache_dir=tmp_path).get("KokoroTTS/key") is None
+        assert not list(tmp_path.glob("*/*"))
+
+    @pytest.mark.parametrize("metadata", [
+        "not json",
+        "[]",
+        '{"chunks": [2], "dtype": null, "sample_rate": 22050, "encoded_format": "pcm"}',
+        '{"created_at": "now", "chunks": [2], "dtype": null, "sample_rate": 22050, "encoded_format": "pcm"}',
+        '{"created_at": 0, "chunks": 2, "dtype": null, "sample_rate": 22050, "encoded_format": "pcm"}',
+        '{"created_at": 0, "chunks": [4], "dtype": null, "sample_rate": 22050, "encoded_format": "pcm"}',
+        '{"created_at": 0, "chunks": [2], "dtype": "bogus", "sample_rate": 22050, "encoded_format": "raw"}',
+    ])
+    def test_corrupt_metadata(self, tmp_path, metadata: str):
+        """Test entries with unreadable or ill-shaped metadata are deleted and missed."""
+        ResponseCache(cache_dir=tmp_path).put("KokoroTTS/key", [AudioData(b"\x00\x00", 22050, "pcm")])
+        (tmp_path / "KokoroTTS" / "key.json").write_text(metadata)
+
+        assert ResponseCache(cache_dir=tmp_path).get("KokoroTTS/key") is None
+        assert not list(tmp_path.glob("*/*"))
+
+    def test_concurrent_writers(self, tmp_path):
+        """Test concurrent puts of one key leave a complete entry and no temporary files."""
+        chunks = [AudioData(bytes(1000), 22050, "pcm")]
+        caches = [ResponseCache(cache_dir=tmp_path) for _ in range(8)]
+        threads = [
+            threading.Thread(target=lambda cache=cache: [cache.put("KokoroTTS/key", chunks) for _ in range(20)])
+            for cache in caches
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        loaded = ResponseCache(cache_dir=tmp_path).get("KokoroTTS/key")
+        assert loaded[0].data == bytes(1000)
+        assert sorted(path.name for path in (tmp_path / "KokoroTTS").iterdir()) == ["key.bin", "key.json"]
+
+    def test_disk_size_limit(self, tmp_path):
+        """Test the least recently used entries are deleted past max_disk_bytes."""
+        cache = ResponseCache(cache_dir=tmp_path, max_disk_bytes=250)
+        chunks = [AudioData(bytes(100), 22050, "pcm")]
+        cache.put("KokoroTTS/a", chunks)
+        cache.put("KokoroTTS/b", chunks)
+        os.utime(tmp_path / "KokoroTTS" / "a.bin", (0, 0))
+        os.utime(tmp_path / "KokoroTTS" / "b.bin", (1, 1))
+        cache.put("KokoroTTS/c", chunks)
+
+        fresh = ResponseCache(cache_dir=tmp_path)
+        assert fresh.get("KokoroTTS/a") is None
+        assert fresh.get("KokoroTTS/b") is not None
+        assert fresh.get("KokoroTTS/c") is not None
+
+    def test_disk_scan_deferred(self, tmp_path, monkeypatch):
+        """Test puts below max_disk_bytes do not rescan the store after the first."""
+        cache = ResponseCache(cache_dir=tmp_path, max_disk_bytes=1000)
+        scans = []
+        disk_entries = cache._disk_entries
+        monkeypatch.setattr(cache, "_disk_entries", lambda: scans.append(1) or disk_entries())
+
+        for i in range(5):
+            cache.put(f"KokoroTTS/{i}", [AudioData(bytes(100), 22050, "pcm")])
+        assert len(scans) == 1
+
+        cache.put("KokoroTTS/big", [AudioData(bytes(600), 22050, "pcm")])
+        assert len(scans) == 2
+        assert sum(path.stat().st_size for path in tmp_path.glob("*/*.bin")) <= 1000
+
+    def test_prune_expired(self, tmp_path):
+        """Test prune() deletes expired entries from disk."""
+        ResponseCache(cache_dir=tmp_path).put("KokoroTTS/key", [AudioData(b"\x00\x00", 22050, "pcm")])
+
+        ResponseCache(cache_dir=tmp_path, ttl=-1).prune()
+
+        assert not list(tmp_path.glob("*/*"))
+
+class TestCachedProvider:
+    """Test caching of provider run() and stream() calls."""
+
+    def test_disabled(self):
+        """Test providers without a cache always synthesize."""
+        tts = CountingTTS(None)
+        tts.run("hello")
+        tts.run("hello")
+
+        assert tts.calls == 2
+
+    def test_run(self, tmp_path):
+        """Test repeated run() calls are served from the cache."""
+        tts = CountingTTS(ResponseCache(cache_dir=tmp_path))
+        first = tts.run("hello")
+        second = tts.run("hello", voice="a")
+        tts.run("hello", voice="b")
+
+        assert tts.calls == 2
+        assert second.data == first.data
+
+    def test_config_in_key(self, tmp_path):
+        """Test instances with different settings do not share cached audio."""
+        CountingTTS(ResponseCache(cache_dir=tmp_path), lang_code="a").run("hello")
+        tts = CountingTTS(ResponseCache(cache_dir=tmp_path), lang_code="b")
+        tts.run("hello")
+
+        assert tts.calls == 1
+
+    def test_stream_replay(self, tmp_path):
+        """Test a completed stream replays with the same chunks."""
+        tts = CountingTTS(ResponseCache(cache_dir=tmp_path))
+        first = list(tts.stream("one three"))
+        replay = list(CountingTTS(ResponseCache(cache_dir=tmp_path)).stream("one three"))
+
+        assert len(replay) == len(first) == 2
+        for original, restored in zip(first, replay):
+            np.testing.assert_array_equal(restored.data, original.data)
@@ -0,0 +1,87 @@
+import pytest
+import asyncio
+
+from polytts._chunking import (
+    ChunkCoalescer,
+    align_chunks,
+    align_chunks_async,
+    coalesce_chunks,
+    coalesce_chunks_async,
+)
+
+class TestCoalesceChunks:
+    """Test regrouping of streamed byte chunks."""
+
+    def test_merges_small_chunks(self):
+        """Test small chunks are merged and split on frame boundaries."""
+        chunks = list(coalesce_chunks([b"abc", b"de", b"f" * 9, b"g"], 4, 2))
+
+        assert chunks == [b"abcd", b"e" + b"f" * 9, b"g\x00"]
+
+    def test_passes_large_chunks_through(self):
+        """Test aligned chunks at or above the target are not copied."""
+        data = b"a" * 8
+
+        assert next(coalesce_chunks([data], 4, 2)) is data
+
+    def test_preserves_bytes(self):
+        """Test an aligned stream is reassembled unchanged."""
+        stream = [bytes([i]) * (i % 7 + 1) for i in range(50)]
+        data = b"".join(stream)
+        data += bytes(-len(data) % 2)
+
+        assert b"".join(coalesce_chunks(stream, 16, 2)) == data
+
+    def test_async(self):
+        """Test the async variant matches the sync one."""
+        stream = [b"abc", b"de", b"f" * 9, b"g"]
+
+        async def source():
+            for data in stream:
+                yield data
+
+        async def collect():
+            return [chunk async for chunk in coalesce_chunks_async(source(), 4, 2)]
+
+        assert asyncio.run(collect()) == list(coalesce_chunks(stream, 4, 2))
+
+    def test_max_delay_flushes_early(self):
+        """Test buffered data is emitted once max_delay has passed."""
+        coalescer = ChunkCoalescer(1024, 2, max_delay=0.0)
+
+        assert coalescer.push(b"abc") == b"ab"
+        assert coalescer.push(b"d") == b"cd"
+
+    def test_invalid_chunk_size(self):
+        """Test non-positive chunk sizes are rejected."""
+        with pytest.raises(ValueError):
+            ChunkCoalescer(0)
+
+class TestAlignChunks:
+    """Test cutting streamed byte chunks on frame boundaries."""
+
+    def test_carries_partial_frames(self):
+        """Test odd bytes are carried into the next chunk and padded at the end."""
+        chunks = list(align_chunks([b"abc", b"d", b"e", b"fgh"]))
+
+        assert chunks == [b"ab", b"cd", b"efgh"]
+        assert list(align_chunks([b"abc"])) == [b"ab", b"c\x00"]
+
+    def test_passes_aligned_chunks_through(self):
+        """Test aligned chunks are yielded without a copy."""
+        data = b"abcd"
+
+        assert next(align_chunks([data])) is data
+
+    def test_async(self):
+        """Test the async variant matches the sync one."""
+        stream = [b"abc", b"d", b"e", b"fgh", b"i"]
+
+        async def source():
+            for data in stream:
+                yield data
+
+        async def collect():
+            return [chunk async for chunk in align_chunks_async(source())]
+
+        assert asyncio.run(collect()) == list(align_chunks(stream))
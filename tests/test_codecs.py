@@ -1,10 +1,23 @@
+import io
+import sys
+import subprocess
 from typing import Any
-import pytest, filetype
+import pytest
 import numpy as np
 
+from polytts import _codec_kernels
 from polytts.codecs import AudioConverter
 from polytts.constants import AudioFormat, EncodedBytesFormat, DType
 
+def _guess_format(audio: bytes) -> str | None:
+    """Identify WAV or MP3 bytes by their magic bytes, None for anything else."""
+    if audio[:4] == b"RIFF" and audio[8:12] == b"WAVE":
+        return "wav"
+    # An ID3 tag, or an MPEG frame sync of 11 set bits
+    if audio[:3] == b"ID3" or (audio[0] == 0xFF and audio[1] & 0xE0 == 0xE0):
+        return "mp3"
+    return None
+
 class TestConversions:
     """Test audio conversions to bytes and numpy arrays."""
 
@@ -36,19 +49,21 @@ class TestConversions:
 
         audio = AudioConverter.to_bytes(audio, sample_rate, encoded_format, output_format)
 
-        # Verify the bytes output format
-        bytes_type = filetype.guess(audio)
-        match output_format:
-            case "wav":
-                assert bytes_type is not None
-                assert bytes_type.extension == "wav"
-                assert bytes_type.mime == "audio/x-wav"
-            case "mp3":
-                assert bytes_type is not None
-                assert bytes_type.extension == "mp3"
-                assert bytes_type.mime == "audio/mpeg"
-            case "pcm":
-                assert bytes_type is None
+        # Verify the bytes output format, headerless PCM matches neither
+        expected = None if output_format == "pcm" else output_format
+        assert _guess_format(audio) == expected
+
+    @pytest.mark.parametrize("encoded_format", ["pcm", "wav", "mp3"])
+    def test_same_format_returns_input(
+        self,
+        test_audio_data: tuple[int, dict],
+        encoded_format: EncodedBytesFormat
+    ):
+        """Test that same format conversions return the input without re-encoding."""
+        sample_rate, audio_formats = test_audio_data
+        audio = audio_formats[encoded_format]
+
+        assert AudioConverter.to_bytes(audio, sample_rate, encoded_format, encoded_format) is audio
 
     @pytest.mark.parametrize("encoded_format, target_dtype", [
         ("raw", "int16"),
@@ -83,6 +98,161 @@ class TestConversions:
         assert isinstance(audio, np.ndarray)
         assert audio.dtype == target_dtype
 
+    @pytest.mark.parametrize("target_dtype", ["int32", "float16", "float32"])
+    def test_decoded_conversions(
+        self,
+        decoded_int16: dict[str, np.ndarray],
+        target_dtype: DType
+    ):
+        """Test that converting decoded int16 samples keeps their length and scale."""
+        for encoded_format, samples in decoded_int16.items():
+            converted = AudioConverter.to_numpy(samples, "raw", target_dtype)
+            round_trip = AudioConverter.to_numpy(converted, "raw", "int16")
+
+            assert converted.dtype == target_dtype, encoded_format
+            assert converted.shape == samples.shape, encoded_format
+            assert np.abs(round_trip.astype(np.int32) - samples).max() <= 16, encoded_format
+
+    def test_int16_float32_round_trip(self, test_audio_data: tuple[int, dict]):
+        """Test that int16 -> float32 -> int16 preserves samples within one step."""
+        _, audio_formats = test_audio_data
+        audio = audio_formats["raw"]
+
+        as_float = AudioConverter.to_numpy(audio, "raw", "float32")
+        round_trip = AudioConverter.to_numpy(as_float, "raw", "int16")
+
+        assert np.abs(as_float).max() <= 1.0 + 1e-4
+        assert np.abs(round_trip.astype(np.int32) - audio).max() <= 1
+
+    def test_numba_imported_lazily(self):
+        """Test that importing the codecs leaves Numba unloaded until a conversion needs it."""
+        code = (
+            "import sys, numpy as np\n"
+            "from polytts.codecs import AudioConverter\n"
+            "assert 'numba' not in sys.modules\n"
+            "AudioConverter.to_numpy(np.zeros(4, np.int16), 'raw', 'int32')\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_int16_float32_without_numba(self, monkeypatch, test_audio_data: tuple[int, dict]):
+        """Test that the NumPy fallback matches the kernels when Numba is missing."""
+        _, audio_formats = test_audio_data
+        audio = audio_formats["raw"]
+        expected = AudioConverter.to_numpy(audio, "raw", "float32")
+
+        monkeypatch.setattr(_codec_kernels, "_kernels", None)
+        as_float = AudioConverter.to_numpy(audio, "raw", "float32")
+
+        np.testing.assert_allclose(as_float, expected)
+        assert np.abs(AudioConverter.to_numpy(as_float, "raw", "int16").astype(np.int32) - audio).max() <= 1
+
+    @pytest.mark.parametrize("source_dtype", ["float16", "float32"])
+    def test_float_to_int16_saturates(self, source_dtype: str):
+        """Test that out-of-range floats clip instead of wrapping around."""
+        audio = np.array([-2.0, -1.0, 0.0, 1.0, 2.0], dtype=source_dtype)
+
+        converted = AudioConverter.to_numpy(audio, "raw", "int16")
+
+        np.testing.assert_array_equal(converted, [-32768, -32768, 0, 32767, 32767])
+
+    @pytest.mark.parametrize("source_dtype", [
+        "int8", "int16", "int32", "int64",
+        "uint8", "uint16", "uint32",
+        "float16", "float32", "float64",
+    ])
+    @pytest.mark.parametrize("target_dtype", ["int16", "int32", "float16", "float32"])
+    def test_every_source_dtype(self, source_dtype: str, target_dtype: DType):
+        """Test that every numeric dtype converts, with silence mapping to zero."""
+        dtype = np.dtype(source_dtype)
+        silence = 2 ** (8 * dtype.itemsize - 1) if dtype.kind == "u" else 0
+        audio = np.array([silence] * 3, dtype=dtype)
+
+        converted = AudioConverter.to_numpy(audio, "raw", target_dtype)
+
+        assert converted.dtype == target_dtype
+        np.testing.assert_array_equal(converted, [0, 0, 0])
+
+    @pytest.mark.parametrize("invalid_dtype", ["bool", "complex64", "U1"])
+    def test_non_numeric_dtype_rejected(self, invalid_dtype: str):
+        """Test that arrays which are not integer or float samples are rejected."""
+        with pytest.raises(ValueError):
+            AudioConverter.to_numpy(np.zeros(3, dtype=invalid_dtype), "raw", "float32")
+
+    @pytest.mark.parametrize("source_dtype", ["uint8", "uint16"])
+    def test_unsigned_to_float(self, source_dtype: str):
+        """Test that unsigned samples are centred on their midpoint when scaled."""
+        info = np.iinfo(source_dtype)
+        audio = np.array([0, info.max // 2 + 1, info.max], dtype=source_dtype)
+
+        converted = AudioConverter.to_numpy(audio, "raw", "float32")
+
+        np.testing.assert_allclose(converted, [-1.0, 0.0, 1.0], atol=1e-2)
+
+    @pytest.mark.parametrize("extra_chunks", [False, True])
+    def test_wav_to_pcm_payload(self, test_audio_data: tuple[int, dict], extra_chunks: bool):
+        """Test that WAV to PCM returns exactly the PCM payload of the WAV."""
+        sample_rate, audio_formats = test_audio_data
+        wav = audio_formats["wav"]
+        if extra_chunks:
+            list_chunk = b"LIST" + (4).to_bytes(4, "little") + b"INFO"
+            body = wav[12:36] + list_chunk + wav[36:]
+            wav = b"RIFF" + (len(body) + 4).to_bytes(4, "little") + b"WAVE" + body
+
+        pcm = AudioConverter.to_bytes(wav, sample_rate, "wav", "pcm")
+
+        assert pcm == audio_formats["pcm"]
+
+    def test_wav_with_extra_chunks(self, test_audio_data: tuple[int, dict]):
+        """Test that WAV decoding skips chunks placed before the data chunk."""
+        _, audio_formats = test_audio_data
+        wav = audio_formats["wav"]
+        list_chunk = b"LIST" + (4).to_bytes(4, "little") + b"INFO"
+        body = wav[12:36] + list_chunk + wav[36:]
+        wav = b"RIFF" + (len(body) + 4).to_bytes(4, "little") + b"WAVE" + body
+
+        audio = AudioConverter.to_numpy(wav, "wav", "int16")
+
+        np.testing.assert_array_equal(audio, audio_formats["raw"])
+
+    def test_mp3_duration_cbr(self, test_audio_data: tuple[int, dict]):
+        """Test that the header-only MP3 duration matches mutagen for CBR data."""
+        mutagen_mp3 = pytest.importorskip("mutagen.mp3")
+        _, audio_formats = test_audio_data
+        mp3 = audio_formats["mp3"]
+
+        expected = mutagen_mp3.MP3(io.BytesIO(mp3)).info.length
+
+        assert AudioConverter._parse_mp3_duration(mp3) == pytest.approx(expected)
+
+    def test_mp3_duration_xing(self, test_audio_data: tuple[int, dict]):
+        """Test that a Xing frame count is used when present."""
+        sample_rate, audio_formats = test_audio_data
+        mp3 = audio_formats["mp3"]
+        # Mono MPEG-2 frame: 4 header bytes and 9 bytes of side information
+        xing = b"Xing" + (1).to_bytes(4, "big") + (40).to_bytes(4, "big")
+        mp3 = mp3[:4] + bytes(9) + xing + mp3[4 + 9 + len(xing):]
+
+        assert AudioConverter._parse_mp3_duration(mp3) == pytest.approx(40 * 576 / sample_rate)
+
+    def test_mp3_duration_unknown_header(self):
+        """Test that data without an MPEG frame sync is left to mutagen."""
+        assert AudioConverter._parse_mp3_duration(b"\x00" * 64) is None
+
+    def test_stream_decode_mp3(self, test_audio_data: tuple[int, dict]):
+        """Test that MP3 bytes decode incrementally across arbitrary chunk boundaries."""
+        pytest.importorskip("miniaudio")
+        sample_rate, audio_formats = test_audio_data
+        mp3 = audio_formats["mp3"]
+        chunks = [mp3[i:i + 1000] for i in range(0, len(mp3), 1000)]
+
+        decoded = list(AudioConverter.stream_decode_mp3(chunks, sample_rate))
+
+        assert len(decoded) > 1
+        assert all(samples.dtype == np.int16 for samples in decoded)
+        total = sum(len(samples) for samples in decoded)
+        assert total == pytest.approx(sample_rate, rel=0.1)
+
 class TestValidations:
     """Test input validations for audio conversions."""
 
@@ -0,0 +1,99 @@
+import sys
+import types
+import pytest
+import numpy as np
+from typing import Any
+
+class FakeT2SModel:
+    """Stand-in for the text-to-semantic model, with the method inference calls."""
+
+    def infer_panel(self, *args: Any, **kwargs: Any):
+        return "uncompiled"
+
+class FakeTTS:
+    """Stand-in for GPT-SoVITS's TTS pipeline."""
+
+    fail_warmup = False
+
+    def __init__(self, config: Any):
+        self.t2s_model = types.SimpleNamespace(model=FakeT2SModel())
+        self.configs = types.SimpleNamespace(sampling_rate=32000)
+
+    def run(self, inputs: dict):
+        if FakeTTS.fail_warmup and inputs["text"] == "Warming up...":
+            raise RuntimeError("warmup failed")
+        yield 32000, np.zeros(4, dtype=np.int16)
+
+@pytest.fixture
+def fake_modules(monkeypatch):
+    """Install fake torch and GPT_SoVITS modules, returning the fake torch."""
+    torch = types.ModuleType("torch")
+    torch.device = lambda name: types.SimpleNamespace(type=name)
+    torch.cuda = types.SimpleNamespace(is_available=lambda: False)
+    torch.compiled = []
+
+    def compile(fn, **kwargs):
+        torch.compiled.append(fn)
+        return lambda *args, **kw: "compiled"
+
+    torch.compile = compile
+
+    tts_module = types.ModuleType("GPT_SoVITS.TTS_infer_pack.TTS")
+    tts_module.TTS = FakeTTS
+    tts_module.TTS_Config = type(
+        "TTS_Config",
+        (),
+        {"default_configs": {"v2ProPlus": {}}, "__init__": lambda self, config: None}
+    )
+
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    monkeypatch.setitem(sys.modules, "GPT_SoVITS", types.ModuleType("GPT_SoVITS"))
+    monkeypatch.setitem(sys.modules, "GPT_SoVITS.TTS_infer_pack", types.ModuleType("GPT_SoVITS.TTS_infer_pack"))
+    monkeypatch.setitem(sys.modules, "GPT_SoVITS.TTS_infer_pack.TTS", tts_module)
+    monkeypatch.setattr(FakeTTS, "fail_warmup", False)
+    return torch
+
+class TestGPTSovitsTTS:
+    """Test GPT-SoVITS provider setup against a fake model."""
+
+    def test_compile_wraps_infer_panel(self, fake_modules):
+        """Test compile_model compiles the decoding loop inference actually calls."""
+        from polytts.providers.gptsovits import GPTSovitsTTS
+
+        tts = GPTSovitsTTS(compile_model=True)
+        model = tts.client.t2s_model.model
+
+        assert [fn.__name__ for fn in fake_modules.compiled] == ["infer_panel"]
+        assert model.infer_panel() == "compiled"
+
+    def test_compile_unavailable(self, fake_modules):
+        """Test torch versions without torch.compile warn and run uncompiled."""
+        from polytts.providers.gptsovits import GPTSovitsTTS
+
+        del fake_modules.compile
+        with pytest.warns(UserWarning):
+            tts = GPTSovitsTTS(compile_model=True)
+
+        assert tts.client.t2s_model.model.infer_panel() == "uncompiled"
+
+    def test_warmup_ready(self, fake_modules):
+        """Test wait_ready() returns True once a successful warmup finishes."""
+        from polytts.providers.gptsovits import GPTSovitsTTS
+
+        tts = GPTSovitsTTS(warmup_model=True)
+
+        assert tts.wait_ready(timeout=5)
+        assert tts.run("Hello").sample_rate == 32000
+
+    def test_warmup_failure(self, fake_modules):
+        """Test a failed warmup is raised from wait_ready() and run()."""
+        from polytts.providers.gptsovits import GPTSovitsTTS
+
+        FakeTTS.fail_warmup = True
+        tts = GPTSovitsTTS(warmup_model=True)
+
+        with pytest.raises(RuntimeError, match="warmup failed") as exc_info:
+            tts.wait_ready(timeout=5)
+        assert str(exc_info.value.__cause__) == "warmup failed"
+        with pytest.raises(RuntimeError):
+            tts.run("Hello")